@@ -65,7 +65,7 @@ def cmd_clear(args):
 try:
     from .pulse.core import pulse
     from .pulse.types import PulseScope
-    from .pulse.audit import log_pulse_event
+    from .pulse.audit import log_pulse_event, flush as flush_pulse_audit
 except ImportError:
     pulse = None
 
@@ -135,198 +135,245 @@ def cmd_test_gates(args):
     return 0 if failed == 0 else 1
 
 
+def _pulse_issue(args: argparse.Namespace):
+    """Issue a signed delegation token."""
+    # Parse scopes
+    try:
+        scopes = [PulseScope(s) for s in args.scopes.split(",")]
+    except ValueError as e:
+        print(f"Error: Invalid scope. Allowed: {[s.value for s in PulseScope]}")
+        return 1
+        
+    token = pulse.issue_token(
+        issued_to=args.device_id,
+        scopes=scopes,
+        duration_seconds=args.duration
+    )
+    
+    # Log issuance
+    log_pulse_event("token_issue", {
+        "token_id": token.token_id,
+        "issued_to": token.issued_to,
+        "scopes": [s.value for s in token.scope]
+    })
+    # The event is written in the background; make sure it reached the log
+    # (raises OSError otherwise) before handing out the token
+    flush_pulse_audit()
+    
+    print(f"Token Issued: {token.token_id}")
+    print(f"Signature: {token.signature}")
+    print(f"Expires: {token.end.isoformat()}")
+    
+    # For programmatic use, maybe output JSON?
+    import json
+    with open(f"{token.token_id}.token.json", "w") as f:
+         f.write(token.model_dump_json(indent=2))
+    print(f"Token saved to {token.token_id}.token.json")
+    return 0
+
+
+def _pulse_verify(args: argparse.Namespace):
+    """Verify a token file."""
+    try:
+        import json
+        from .pulse.types import PulseToken
+        with open(args.token_file, 'r') as f:
+            data = json.load(f)
+            token = PulseToken(**data)
+        
+        is_valid = pulse.verify_token(token)
+        if is_valid:
+            print("✅ Token is VALID")
+            return 0
+        else:
+            print("❌ Token is INVALID or EXPIRED")
+            return 1
+    except Exception as e:
+        print(f"Error verifying token: {e}")
+        return 1
+
+
+PULSE_COMMANDS = {
+    "issue": _pulse_issue,
+    "verify": _pulse_verify,
+}
+
+
 def cmd_pulse(args: argparse.Namespace):
     """Handle pulse commands."""
     if not pulse:
         print("Error: Pulse module not available.")
         return 1
 
-    if args.pulse_command == "issue":
-        # Parse scopes
-        try:
-            scopes = [PulseScope(s) for s in args.scopes.split(",")]
-        except ValueError as e:
-            print(f"Error: Invalid scope. Allowed: {[s.value for s in PulseScope]}")
-            return 1
-            
-        token = pulse.issue_token(
-            issued_to=args.device_id,
-            scopes=scopes,
-            duration_seconds=args.duration
-        )
-        
-        # Log issuance
-        log_pulse_event("token_issue", {
-            "token_id": token.token_id,
-            "issued_to": token.issued_to,
-            "scopes": [s.value for s in token.scope]
-        })
+    handler = PULSE_COMMANDS.get(args.pulse_command)
+    if handler is None:
+        print("Unknown pulse command")
+        return 1
+    return handler(args)
+
+
+def _forensics_list(args: argparse.Namespace):
+    """List captured sessions."""
+    sessions = list_sessions(date=args.date if hasattr(args, 'date') else None)
+    if not sessions:
+        print("No sessions found.")
+        return 0
+    
+    print(f"⟡ Sessions ({len(sessions)})")
+    print("=" * 60)
+    for s in sessions[:20]:  # Limit to 20
+        status = "✓" if s.get("ended_at") else "⏳"
+        print(f"{status} {s.get('session_id', '')[:8]}... | "
+              f"{s.get('started_at', '')[:19]} | "
+              f"{s.get('total_actions', 0)} actions")
+    return 0
+
+
+def _forensics_view(args: argparse.Namespace):
+    """Show a session summary."""
+    try:
+        replay = SessionReplay(args.session_id)
+        data = replay.session_data
         
-        print(f"Token Issued: {token.token_id}")
-        print(f"Signature: {token.signature}")
-        print(f"Expires: {token.end.isoformat()}")
+        print(f"⟡ Session: {data.get('session_id')}")
+        print(f"Started: {data.get('started_at')}")
+        print(f"Ended: {data.get('ended_at', 'In Progress')}")
+        print(f"Actor: {data.get('actor')}")
+        print(f"Mode: {data.get('context_mode')}")
+        print()
         
-        # For programmatic use, maybe output JSON?
-        import json
-        with open(f"{token.token_id}.token.json", "w") as f:
-             f.write(token.model_dump_json(indent=2))
-        print(f"Token saved to {token.token_id}.token.json")
+        metrics = replay.metrics
+        print(f"Total Actions: {metrics.get('total_actions', 0)}")
+        print(f"Blocked: {metrics.get('blocked_actions', 0)}")
+        print(f"Rewrites: {metrics.get('rewrites', 0)}")
+        print(f"Tripwires: {metrics.get('tripwires_triggered', 0)}")
         return 0
-        
-    elif args.pulse_command == "verify":
-        try:
-            import json
-            from .pulse.types import PulseToken
-            with open(args.token_file, 'r') as f:
-                data = json.load(f)
-                token = PulseToken(**data)
-            
-            is_valid = pulse.verify_token(token)
-            if is_valid:
-                print("✅ Token is VALID")
-                return 0
-            else:
-                print("❌ Token is INVALID or EXPIRED")
-                return 1
-        except Exception as e:
-            print(f"Error verifying token: {e}")
-            return 1
-            
-    else:
-        print("Unknown pulse command")
+    except FileNotFoundError:
+        print(f"Session not found: {args.session_id}")
+        return 1
+
+
+def _forensics_export(args: argparse.Namespace):
+    """Export a session to disk."""
+    try:
+        path = export_session(args.session_id, format=args.format)
+        print(f"✅ Exported to: {path}")
+        return 0
+    except Exception as e:
+        print(f"Export failed: {e}")
         return 1
 
 
+FORENSICS_COMMANDS = {
+    "list": _forensics_list,
+    "view": _forensics_view,
+    "export": _forensics_export,
+}
+
+
 def cmd_forensics(args: argparse.Namespace):
     """Handle forensics commands."""
     if not FORENSICS_AVAILABLE:
         print("Error: Forensics module not available.")
         return 1
     
-    if args.forensics_command == "list":
-        sessions = list_sessions(date=args.date if hasattr(args, 'date') else None)
-        if not sessions:
-            print("No sessions found.")
-            return 0
+    handler = FORENSICS_COMMANDS.get(args.forensics_command)
+    if handler is None:
+        print("Unknown forensics command")
+        return 1
+    return handler(args)
+
+
+def _audit_decision(args: argparse.Namespace):
+    """Show a single DBB decision record."""
+    try:
+        dbb = DBBGenerator()
+        record = dbb.load(args.decision_id)
+        
+        if not record:
+            print(f"Decision not found: {args.decision_id}")
+            return 1
         
-        print(f"⟡ Sessions ({len(sessions)})")
+        print(f"⟡ Decision Audit: {record.get('decision_id')}")
         print("=" * 60)
-        for s in sessions[:20]:  # Limit to 20
-            status = "✓" if s.get("ended_at") else "⏳"
-            print(f"{status} {s.get('session_id', '')[:8]}... | "
-                  f"{s.get('started_at', '')[:19]} | "
-                  f"{s.get('total_actions', 0)} actions")
+        print(f"Timestamp: {record.get('temporal_anchor', {}).get('iso8601')}")
+        print(f"Type: {record.get('decision_type')}")
+        print(f"Target: {record.get('target')}")
+        print(f"Confidence: {record.get('confidence', 0):.0%}")
+        print(f"Signoff: {'✓' if record.get('steward_signoff') else '—'}")
+        print()
+        print("Reasoning Trace:")
+        for step in record.get("reasoning_trace", []):
+            print(f"  • {step}")
+        print()
+        print(f"Chain Hash: {record.get('chain_hash', 'N/A')[:16]}...")
         return 0
+    except Exception as e:
+        print(f"Audit failed: {e}")
+        return 1
+
+
+def _audit_list(args: argparse.Namespace):
+    """List DBB decisions."""
+    dbb = DBBGenerator()
+    decisions = dbb.list_decisions(date=args.date if hasattr(args, 'date') else None)
     
-    elif args.forensics_command == "view":
-        try:
-            replay = SessionReplay(args.session_id)
-            data = replay.session_data
-            
-            print(f"⟡ Session: {data.get('session_id')}")
-            print(f"Started: {data.get('started_at')}")
-            print(f"Ended: {data.get('ended_at', 'In Progress')}")
-            print(f"Actor: {data.get('actor')}")
-            print(f"Mode: {data.get('context_mode')}")
-            print()
-            
-            metrics = replay.metrics
-            print(f"Total Actions: {metrics.get('total_actions', 0)}")
-            print(f"Blocked: {metrics.get('blocked_actions', 0)}")
-            print(f"Rewrites: {metrics.get('rewrites', 0)}")
-            print(f"Tripwires: {metrics.get('tripwires_triggered', 0)}")
-            return 0
-        except FileNotFoundError:
-            print(f"Session not found: {args.session_id}")
-            return 1
+    if not decisions:
+        print("No decisions found.")
+        return 0
     
-    elif args.forensics_command == "export":
-        try:
-            path = export_session(args.session_id, format=args.format)
-            print(f"✅ Exported to: {path}")
-            return 0
-        except Exception as e:
-            print(f"Export failed: {e}")
-            return 1
+    print(f"⟡ Decisions ({len(decisions)})")
+    print("=" * 60)
+    for d in decisions[:20]:
+        signoff = "✓" if d.get("signoff") else "—"
+        print(f"{signoff} {d.get('decision_id', '')[:8]}... | "
+              f"{d.get('type', '')} | {d.get('target', '')[:30]}")
+    return 0
+
+
+def _audit_worldview(args: argparse.Namespace):
+    """Export the world view at a given action."""
+    try:
+        path = export_world_view(args.session_id, int(args.action_index))
+        print(f"✅ World view exported to: {path}")
+        return 0
+    except Exception as e:
+        print(f"World view export failed: {e}")
+        return 1
+
+
+def _audit_verify(args: argparse.Namespace):
+    """Verify chain integrity."""
+    from .crypto import verify_chain
+    valid, error = verify_chain()
     
+    if valid:
+        print("✅ Audit chain is intact")
+        return 0
     else:
-        print("Unknown forensics command")
+        print(f"❌ Chain broken: {error}")
         return 1
 
 
+AUDIT_COMMANDS = {
+    "decision": _audit_decision,
+    "list": _audit_list,
+    "worldview": _audit_worldview,
+    "verify": _audit_verify,
+}
+
+
 def cmd_audit(args: argparse.Namespace):
     """Handle audit commands."""
     if not FORENSICS_AVAILABLE:
         print("Error: Forensics module not available.")
         return 1
     
-    if args.audit_command == "decision":
-        try:
-            dbb = DBBGenerator()
-            record = dbb.load(args.decision_id)
-            
-            if not record:
-                print(f"Decision not found: {args.decision_id}")
-                return 1
-            
-            print(f"⟡ Decision Audit: {record.get('decision_id')}")
-            print("=" * 60)
-            print(f"Timestamp: {record.get('temporal_anchor', {}).get('iso8601')}")
-            print(f"Type: {record.get('decision_type')}")
-            print(f"Target: {record.get('target')}")
-            print(f"Confidence: {record.get('confidence', 0):.0%}")
-            print(f"Signoff: {'✓' if record.get('steward_signoff') else '—'}")
-            print()
-            print("Reasoning Trace:")
-            for step in record.get("reasoning_trace", []):
-                print(f"  • {step}")
-            print()
-            print(f"Chain Hash: {record.get('chain_hash', 'N/A')[:16]}...")
-            return 0
-        except Exception as e:
-            print(f"Audit failed: {e}")
-            return 1
-    
-    elif args.audit_command == "list":
-        dbb = DBBGenerator()
-        decisions = dbb.list_decisions(date=args.date if hasattr(args, 'date') else None)
-        
-        if not decisions:
-            print("No decisions found.")
-            return 0
-        
-        print(f"⟡ Decisions ({len(decisions)})")
-        print("=" * 60)
-        for d in decisions[:20]:
-            signoff = "✓" if d.get("signoff") else "—"
-            print(f"{signoff} {d.get('decision_id', '')[:8]}... | "
-                  f"{d.get('type', '')} | {d.get('target', '')[:30]}")
-        return 0
-    
-    elif args.audit_command == "worldview":
-        try:
-            path = export_world_view(args.session_id, int(args.action_index))
-            print(f"✅ World view exported to: {path}")
-            return 0
-        except Exception as e:
-            print(f"World view export failed: {e}")
-            return 1
-    
-    elif args.audit_command == "verify":
-        # Verify chain integrity
-        from .crypto import verify_chain
-        valid, error = verify_chain()
-        
-        if valid:
-            print("✅ Audit chain is intact")
-            return 0
-        else:
-            print(f"❌ Chain broken: {error}")
-            return 1
-    
-    else:
+    handler = AUDIT_COMMANDS.get(args.audit_command)
+    if handler is None:
         print("Unknown audit command")
         return 1
+    return handler(args)
 
 
 def main():
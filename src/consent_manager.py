@@ -11,7 +11,9 @@ Permissions have:
 """
 
 import sqlite3
+import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from enum import Enum
@@ -75,6 +77,9 @@ class Permission:
 
 DB_PATH = Path.home() / ".mirrordna" / "oversight" / "permissions.db"
 
+# Permission-check cache entry limit
+PERMISSION_CACHE_SIZE = 1024
+
 
 class ConsentManager:
     """
@@ -85,6 +90,21 @@ class ConsentManager:
         self.db_path = db_path or DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_db()
+        
+        # (scope, action, target, context) -> (perm_id, expires_at), with
+        # perm_id None for no match. Checks share one connection, whose
+        # PRAGMA data_version changes when any other connection (another
+        # manager or process) commits; the cache is dropped when it does.
+        # Changes made through this manager drop it directly.
+        self._check_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._check_lock = threading.Lock()
+        self._check_conn: Optional[sqlite3.Connection] = None
+        self._check_data_version: Optional[int] = None
+    
+    def _invalidate_checks(self):
+        """Drop cached permission checks after the permission set changes."""
+        with self._check_lock:
+            self._check_cache.clear()
     
     def _init_db(self):
         """Initialize the SQLite database."""
@@ -178,6 +198,7 @@ class ConsentManager:
             ))
             conn.commit()
         
+        self._invalidate_checks()
         return permission
     
     def revoke_permission(self, permission_id: str) -> bool:
@@ -188,7 +209,9 @@ class ConsentManager:
                 (permission_id,)
             )
             conn.commit()
-            return cursor.rowcount > 0
+        
+        self._invalidate_checks()
+        return cursor.rowcount > 0
     
     def check_permission(
         self,
@@ -202,27 +225,53 @@ class ConsentManager:
         Returns True if allowed, False otherwise.
         """
         now = datetime.now(timezone.utc).isoformat()
+        key = (scope, action, target, context)
         
-        with sqlite3.connect(self.db_path) as conn:
-            # Find matching permissions (not expired, matching context or no context lock)
-            cursor = conn.execute("""
-                SELECT id, target, context_lock FROM permissions
-                WHERE scope = ? AND action = ?
-                AND (expires_at IS NULL OR expires_at > ?)
-            """, (scope.value, action.value, now))
+        with self._check_lock:
+            if self._check_conn is None:
+                # Serialized by _check_lock, so it may be used from any thread
+                self._check_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn = self._check_conn
             
-            for row in cursor:
-                perm_id, perm_target, context_lock = row
+            with conn:
+                data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+                if data_version != self._check_data_version:
+                    self._check_cache.clear()
+                    self._check_data_version = data_version
                 
-                # Check target pattern match
-                if self._match_target(target, perm_target):
-                    # Check context lock
-                    if context_lock == "null" or (context and context.value == context_lock):
-                        # Record usage
-                        self._record_usage(perm_id)
-                        return True
-        
-        return False
+                cached = self._check_cache.get(key)
+                if cached is not None and (cached[1] is None or cached[1] > now):
+                    self._check_cache.move_to_end(key)
+                    match = cached if cached[0] is not None else None
+                else:
+                    match = None
+                    # Find matching permissions (not expired, matching context or no context lock)
+                    cursor = conn.execute("""
+                        SELECT id, target, context_lock, expires_at FROM permissions
+                        WHERE scope = ? AND action = ?
+                        AND (expires_at IS NULL OR expires_at > ?)
+                    """, (scope.value, action.value, now))
+                    
+                    for row in cursor:
+                        perm_id, perm_target, context_lock, expires_at = row
+                        
+                        # Check target pattern match
+                        if self._match_target(target, perm_target):
+                            # Check context lock
+                            if context_lock == "null" or (context and context.value == context_lock):
+                                match = (perm_id, expires_at)
+                                break
+                    
+                    self._check_cache[key] = match or (None, None)
+                    if len(self._check_cache) > PERMISSION_CACHE_SIZE:
+                        self._check_cache.popitem(last=False)
+                
+                if match is None:
+                    return False
+                
+                # Record usage
+                self._record_usage(match[0], conn)
+                return True
     
     def _match_target(self, actual: str, pattern: str) -> bool:
         """Check if actual target matches pattern (supports * wildcard)."""
@@ -233,15 +282,17 @@ class ConsentManager:
             return actual.startswith(prefix)
         return actual == pattern
     
-    def _record_usage(self, permission_id: str):
+    def _record_usage(self, permission_id: str, conn: Optional[sqlite3.Connection] = None):
         """Record permission usage for escalation tracking."""
+        if conn is None:
+            with sqlite3.connect(self.db_path) as conn:
+                return self._record_usage(permission_id, conn)
         now = datetime.now(timezone.utc).isoformat()
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO permission_usage (permission_id, used_at, action_count)
-                VALUES (?, ?, 1)
-            """, (permission_id, now))
-            conn.commit()
+        conn.execute("""
+            INSERT INTO permission_usage (permission_id, used_at, action_count)
+            VALUES (?, ?, 1)
+        """, (permission_id, now))
+        conn.commit()
     
     def get_permission(self, permission_id: str) -> Optional[Permission]:
         """Get a permission by ID."""
@@ -286,6 +337,17 @@ class ConsentManager:
             
             return [self._row_to_permission(row) for row in cursor]
     
+    def count_permissions(self) -> int:
+        """Count active (unexpired) permissions without materializing them."""
+        now = datetime.now(timezone.utc).isoformat()
+        
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute("""
+                SELECT COUNT(*) FROM permissions 
+                WHERE expires_at IS NULL OR expires_at > ?
+            """, (now,))
+            return cursor.fetchone()[0]
+    
     def _row_to_permission(self, row) -> Permission:
         """Convert a database row to a Permission object."""
         return Permission(
@@ -337,7 +399,10 @@ class ConsentManager:
             """)
             
             conn.commit()
-            return deleted
+        
+        if deleted:
+            self._invalidate_checks()
+        return deleted
     
     def check_escalation_triggers(self, permission_id: str) -> List[str]:
         """
@@ -36,6 +36,9 @@ CHAIN_STATE = MIRRORGATE_DIR / "chain_state.json"
 
 MIRRORGATE_VERSION = "2.0"
 
+# (path, inode, mtime_ns, size) of private.pem and the key parsed from it
+_private_key_cache: Optional[tuple] = None
+
 
 def ensure_directories():
     """Create MirrorGate directories if they don't exist."""
@@ -45,6 +48,7 @@ def ensure_directories():
 
 def generate_keypair() -> tuple:
     """Generate Ed25519 keypair and save to disk."""
+    global _private_key_cache
     ensure_directories()
     
     private_key = Ed25519PrivateKey.generate()
@@ -65,19 +69,31 @@ def generate_keypair() -> tuple:
     )
     (KEYS_DIR / "public.pem").write_bytes(public_pem)
     
+    # A key rewritten within one mtime tick would otherwise look unchanged
+    _private_key_cache = None
+    
     return private_key, public_key
 
 
 def load_private_key() -> Ed25519PrivateKey:
-    """Load private key from disk, generate if not exists."""
+    """Load private key from disk, generate if not exists (PEM parsed once per key file)."""
+    global _private_key_cache
     private_path = KEYS_DIR / "private.pem"
     
-    if not private_path.exists():
+    try:
+        st = private_path.stat()
+    except FileNotFoundError:
         private_key, _ = generate_keypair()
         return private_key
     
+    stamp = (str(private_path), st.st_ino, st.st_mtime_ns, st.st_size)
+    if _private_key_cache and _private_key_cache[0] == stamp:
+        return _private_key_cache[1]
+    
     private_pem = private_path.read_bytes()
-    return serialization.load_pem_private_key(private_pem, password=None)
+    private_key = serialization.load_pem_private_key(private_pem, password=None)
+    _private_key_cache = (stamp, private_key)
+    return private_key
 
 
 def get_previous_hash() -> str:
@@ -148,18 +164,37 @@ def compute_policy_hash() -> str:
     return combined.hexdigest()[:16]  # Truncate for readability
 
 
+RULES_FILE = Path(__file__).parent.parent / "config" / "rules.yaml"
+MAX_RULES_FILE_SIZE = 1_000_000  # Anything bigger is not a real rules file
+
+# (mtime_ns, size, version) of the last rules.yaml parse
+_rules_version_cache: Optional[tuple] = None
+
+
 def get_rules_version() -> str:
-    """Get version of rules configuration."""
-    rules_file = Path(__file__).parent.parent / "config" / "rules.yaml"
-    if rules_file.exists():
+    """Get version of rules configuration (re-parsed only when rules.yaml changes)."""
+    global _rules_version_cache
+    try:
+        st = RULES_FILE.stat()
+    except OSError:
+        return "1.0"
+    
+    if _rules_version_cache and _rules_version_cache[:2] == (st.st_mtime_ns, st.st_size):
+        return _rules_version_cache[2]
+    
+    version = "1.0"
+    if st.st_size <= MAX_RULES_FILE_SIZE:
         try:
             import yaml
-            with open(rules_file, 'r') as f:
-                data = yaml.safe_load(f)
-                return data.get("version", "1.0")
+            # libyaml-backed loader when available
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            data = yaml.load(RULES_FILE.read_bytes(), Loader=loader)
+            version = data.get("version", "1.0")
         except Exception:
             pass
-    return "1.0"
+    
+    _rules_version_cache = (st.st_mtime_ns, st.st_size, version)
+    return version
 
 
 def generate_decision_record(
@@ -161,6 +161,7 @@ class MirrorGateDaemon:
     def __init__(self, watch_paths: List[str] = None):
         self.watch_paths = watch_paths or DEFAULT_WATCH_PATHS
         self.observer = None
+        self.handler = None
         self.running = False
     
     def start(self):
@@ -189,10 +190,10 @@ class MirrorGateDaemon:
         
         # Setup observer
         self.observer = Observer()
-        handler = MirrorGateHandler()
+        self.handler = MirrorGateHandler()
         
         for path in valid_paths:
-            self.observer.schedule(handler, path, recursive=True)
+            self.observer.schedule(self.handler, path, recursive=True)
         
         # Handle shutdown signals
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -216,6 +217,9 @@ class MirrorGateDaemon:
         if self.observer:
             self.observer.stop()
             self.observer.join()
+        if self.handler:
+            # Delete spilled backups of watched files
+            self.handler.interceptor.close()
         log_shutdown()
     
     def _signal_handler(self, signum, frame):
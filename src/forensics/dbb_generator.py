@@ -13,12 +13,21 @@ Schema:
 """
 
 import json
+import os
 import hashlib
 import uuid as uuid_mod
+from collections import OrderedDict
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # Fallback to stdlib json if orjson not available
+    _json_loads = json.loads
 
 
 @dataclass
@@ -75,6 +84,9 @@ class DBBRecord:
 
 DBB_DIR = Path.home() / ".mirrordna" / "dbb"
 
+# Max date directories whose decision summaries are kept in memory
+LISTING_CACHE_DIRS = 32
+
 
 class DBBGenerator:
     """
@@ -82,6 +94,9 @@ class DBBGenerator:
     """
     
     def __init__(self):
+        # date_dir -> (dir mtime_ns, decision summaries); DBB files are
+        # write-once, so a directory is only re-read when files are added
+        self._listing_cache: "OrderedDict[str, Tuple[int, List[Dict]]]" = OrderedDict()
         self._ensure_dirs()
     
     def _ensure_dirs(self):
@@ -144,8 +159,7 @@ class DBBGenerator:
             **self._to_dict(record)
         }
         
-        with open(dbb_file, 'w') as f:
-            json.dump(output, f, indent=2, default=str)
+        self._write_record(dbb_file, output)
         
         return str(dbb_file)
     
@@ -194,11 +208,17 @@ class DBBGenerator:
             **data
         }
         
-        with open(dbb_file, 'w') as f:
-            json.dump(output, f, indent=2, default=str)
+        self._write_record(dbb_file, output)
         
         return True
     
+    def _write_record(self, dbb_file: Path, output: Dict) -> None:
+        """Write a record via a temp file and rename, so listings never see it half-written."""
+        tmp_file = dbb_file.with_name(f".{dbb_file.name}.tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(output, f, indent=2, default=str)
+        os.replace(tmp_file, dbb_file)
+    
     def _find_decision(self, decision_id: str) -> Optional[Path]:
         """Find a decision file by ID."""
         for date_dir in DBB_DIR.iterdir():
@@ -212,8 +232,8 @@ class DBBGenerator:
         """Load a DBB record by ID."""
         path = self._find_decision(decision_id)
         if path:
-            with open(path, 'r') as f:
-                return json.load(f)
+            with open(path, 'rb') as f:
+                return _json_loads(f.read())
         return None
     
     def list_decisions(self, date: Optional[str] = None) -> List[Dict]:
@@ -224,22 +244,57 @@ class DBBGenerator:
         
         for date_dir in dirs:
             if date_dir.is_dir():
-                for dbb_file in date_dir.glob("decision-*.dbb"):
+                decisions.extend(self._list_dir(date_dir))
+        
+        return sorted(decisions, key=lambda x: x.get("timestamp", ""), reverse=True)
+    
+    def _list_dir(self, date_dir: Path) -> List[Dict]:
+        """Summaries for one date directory, cached on the directory mtime."""
+        key = str(date_dir)
+        mtime = date_dir.stat().st_mtime_ns
+        cached = self._listing_cache.get(key)
+        if cached and cached[0] == mtime:
+            self._listing_cache.move_to_end(key)
+            return cached[1]
+        
+        # Reuse summaries for files already parsed on a previous scan
+        known = {d["file"]: d for d in cached[1]} if cached else {}
+        summaries = []
+        complete = True
+        with os.scandir(date_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("decision-") and name.endswith(".dbb")):
+                    continue
+                summary = known.get(entry.path)
+                if summary is None:
                     try:
-                        with open(dbb_file, 'r') as f:
-                            data = json.load(f)
-                            decisions.append({
-                                "decision_id": data.get("decision_id"),
-                                "timestamp": data.get("temporal_anchor", {}).get("iso8601"),
-                                "type": data.get("decision_type"),
-                                "target": data.get("target"),
-                                "signoff": data.get("steward_signoff", False),
-                                "file": str(dbb_file)
-                            })
+                        with open(entry.path, 'rb') as f:
+                            data = _json_loads(f.read())
                     except Exception:
+                        # Possibly mid-write by another process; retry next time
+                        complete = False
                         continue
+                    summary = {
+                        "decision_id": data.get("decision_id"),
+                        "timestamp": data.get("temporal_anchor", {}).get("iso8601"),
+                        "type": data.get("decision_type"),
+                        "target": data.get("target"),
+                        "signoff": data.get("steward_signoff", False),
+                        "file": entry.path
+                    }
+                summaries.append(summary)
         
-        return sorted(decisions, key=lambda x: x.get("timestamp", ""), reverse=True)
+        if not complete:
+            # Don't cache an incomplete scan: the directory mtime won't change
+            # when the unreadable file is finished
+            self._listing_cache.pop(key, None)
+            return summaries
+        self._listing_cache[key] = (mtime, summaries)
+        self._listing_cache.move_to_end(key)
+        if len(self._listing_cache) > LISTING_CACHE_DIRS:
+            self._listing_cache.popitem(last=False)
+        return summaries
     
     def _to_dict(self, obj) -> Dict:
         """Convert dataclass to dict."""
@@ -15,6 +15,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Iterator
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # Fallback to stdlib json if orjson not available
+    _json_loads = json.loads
+
 
 FORENSICS_DIR = Path.home() / ".mirrordna" / "forensics"
 SESSIONS_DIR = FORENSICS_DIR / "sessions"
@@ -48,8 +55,8 @@ class SessionReplay:
             if date_dir.is_dir():
                 session_file = date_dir / f"session-{self.session_id}.json"
                 if session_file.exists():
-                    with open(session_file, 'r') as f:
-                        return json.load(f)
+                    with open(session_file, 'rb') as f:
+                        return _json_loads(f.read())
         
         raise FileNotFoundError(f"Session not found: {self.session_id}")
     
@@ -233,8 +240,8 @@ def list_sessions(date: Optional[str] = None) -> List[Dict]:
         if date_dir.is_dir():
             for session_file in date_dir.glob("session-*.json"):
                 try:
-                    with open(session_file, 'r') as f:
-                        data = json.load(f)
+                    with open(session_file, 'rb') as f:
+                        data = _json_loads(f.read())
                         sessions.append({
                             "session_id": data.get("session_id"),
                             "started_at": data.get("started_at"),
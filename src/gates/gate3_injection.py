@@ -24,7 +24,7 @@ class InjectionPattern:
 
 
 # Core injection patterns - these catch the most common attacks
-INJECTION_PATTERNS = [
+INJECTION_PATTERNS = (
     # Instruction override attempts
     InjectionPattern(
         name="ignore_instructions",
@@ -126,7 +126,14 @@ INJECTION_PATTERNS = [
         severity="critical",
         description="Script injection attempt"
     ),
-]
+)
+
+# Encoding/obfuscation detectors (compiled once, shared by all instances)
+B64_SEGMENT = re.compile(r'[A-Za-z0-9+/]{20,}={0,2}')
+HEX_SEGMENT = re.compile(r'(?:0x)?([0-9a-fA-F]{40,})')
+INVISIBLE_CHARS = re.compile(r'[\u200b\u200c\u200d\u2060\ufeff]')
+CYRILLIC_LOOKALIKES = re.compile(r'[аеорсхуАВЕКМНОРСТХ]')  # Cyrillic that look like Latin
+LATIN_LETTER = re.compile(r'[a-zA-Z]')
 
 
 class Gate3Injection(BaseGate):
@@ -139,7 +146,7 @@ class Gate3Injection(BaseGate):
     is_blocking = True
     
     def __init__(self, additional_patterns: Optional[List[InjectionPattern]] = None):
-        self.patterns = INJECTION_PATTERNS.copy()
+        self.patterns = list(INJECTION_PATTERNS)
         if additional_patterns:
             self.patterns.extend(additional_patterns)
         
@@ -157,8 +164,7 @@ class Gate3Injection(BaseGate):
         violations = []
         
         # Check for base64 encoded segments
-        b64_pattern = re.compile(r'[A-Za-z0-9+/]{20,}={0,2}')
-        for match in b64_pattern.finditer(content):
+        for match in B64_SEGMENT.finditer(content):
             try:
                 decoded = base64.b64decode(match.group()).decode('utf-8', errors='ignore')
                 # Check if decoded content contains injection patterns
@@ -173,8 +179,7 @@ class Gate3Injection(BaseGate):
                 pass  # Not valid base64, ignore
         
         # Check for hex encoded segments
-        hex_pattern = re.compile(r'(?:0x)?([0-9a-fA-F]{40,})')
-        for match in hex_pattern.finditer(content):
+        for match in HEX_SEGMENT.finditer(content):
             try:
                 decoded = bytes.fromhex(match.group(1)).decode('utf-8', errors='ignore')
                 for pattern, compiled in self._compiled:
@@ -191,11 +196,14 @@ class Gate3Injection(BaseGate):
     
     def _check_unicode_obfuscation(self, content: str) -> List[Tuple[str, str]]:
         """Check for Unicode-based obfuscation attempts."""
+        # Both checks look for non-ASCII characters
+        if content.isascii():
+            return []
+        
         violations = []
         
         # Check for invisible characters (zero-width spaces, etc.)
-        invisible_chars = re.compile(r'[\u200b\u200c\u200d\u2060\ufeff]')
-        if invisible_chars.search(content):
+        if INVISIBLE_CHARS.search(content):
             violations.append((
                 "unicode_invisible",
                 "Invisible Unicode characters detected (potential obfuscation)"
@@ -203,8 +211,7 @@ class Gate3Injection(BaseGate):
         
         # Check for homograph attacks (mixing scripts)
         # Simple heuristic: check if Latin letters are mixed with Cyrillic lookalikes
-        cyrillic_lookalikes = re.compile(r'[аеорсхуАВЕКМНОРСТХ]')  # Cyrillic that look like Latin
-        if cyrillic_lookalikes.search(content) and re.search(r'[a-zA-Z]', content):
+        if CYRILLIC_LOOKALIKES.search(content) and LATIN_LETTER.search(content):
             violations.append((
                 "unicode_homograph",
                 "Mixed Latin/Cyrillic characters (potential homograph attack)"
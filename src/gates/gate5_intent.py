@@ -20,7 +20,7 @@ class IntentSignal:
 
 
 # Intent classification signals
-INTENT_SIGNALS = [
+INTENT_SIGNALS = (
     # TRANSACTIONAL: Facts, math, syntax, lookups, code execution
     IntentSignal(r"(?i)(what\s+is|define|explain|how\s+does)", IntentMode.TRANSACTIONAL, 0.7),
     IntentSignal(r"(?i)(calculate|compute|solve|evaluate)", IntentMode.TRANSACTIONAL, 0.9),
@@ -56,7 +56,19 @@ INTENT_SIGNALS = [
     IntentSignal(r"(?i)(wild|crazy|outlandish|absurd)", IntentMode.PLAY, 0.7),
     IntentSignal(r"(?i)(dream|fantasy|magical)", IntentMode.PLAY, 0.75),
     IntentSignal(r"(?i)(write\s+(me\s+)?a\s+(story|poem|song))", IntentMode.PLAY, 0.9),
-]
+)
+
+# Bare greetings/acknowledgements that match none of INTENT_SIGNALS.
+# Checked by set lookup so trivial turns skip the regex scan.
+INSTANT_GREETINGS = frozenset({
+    "hi", "hello", "hey", "yo", "sup", "thanks", "thank you", "ok", "okay",
+    "yes", "no", "yep", "nope", "sure", "nah",
+})
+
+
+def _is_foldable(pattern: str) -> bool:
+    """True if a (?i) pattern matches lowercased text the same way without it."""
+    return pattern.startswith("(?i)") and pattern[4:] == pattern[4:].lower()
 
 
 class Gate5Intent(BaseGate):
@@ -78,6 +90,22 @@ class Gate5Intent(BaseGate):
             (signal, re.compile(signal.pattern))
             for signal in self.signals
         ]
+        
+        # For ASCII input it's cheaper to lowercase once than to case-fold in
+        # every pattern, so keep (?i)-free variants of all-lowercase patterns.
+        # The flag says which text to search: only folded patterns see the
+        # lowercased copy, so case-sensitive signals still match as written.
+        self._compiled_lower = [
+            (signal, re.compile(signal.pattern[4:]), True) if _is_foldable(signal.pattern)
+            else (signal, compiled, False)
+            for signal, compiled in self._compiled
+        ]
+        self._compiled_original = [
+            (signal, compiled, False) for signal, compiled in self._compiled
+        ]
+        
+        # Greeting fast path only holds for the default signal table
+        self._greetings = INSTANT_GREETINGS if self.signals is INTENT_SIGNALS else frozenset()
     
     def _classify(self, content: str) -> Tuple[IntentMode, float, Dict[IntentMode, float]]:
         """
@@ -91,9 +119,19 @@ class Gate5Intent(BaseGate):
         }
         match_counts: Dict[IntentMode, int] = {m: 0 for m in IntentMode}
         
+        if content.isascii():
+            lowered, compiled_signals = content.lower(), self._compiled_lower
+        else:
+            # Unicode case folding isn't the same as str.lower(); keep re.I
+            lowered, compiled_signals = content, self._compiled_original
+        
+        # Same outcome as a scan with no matching signals
+        if lowered.strip().rstrip(".!?").lower() in self._greetings:
+            return IntentMode.TRANSACTIONAL, 0.3, scores
+        
         # Score each signal
-        for signal, compiled in self._compiled:
-            if compiled.search(content):
+        for signal, compiled, folded in compiled_signals:
+            if compiled.search(lowered if folded else content):
                 scores[signal.mode] += signal.weight
                 match_counts[signal.mode] += 1
         
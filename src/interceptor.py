@@ -7,14 +7,35 @@ Handles backup and revert for blocked writes.
 """
 
 import os
+import hashlib
 import shutil
 import tempfile
+import uuid
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 
 from .crypto import compute_file_hash
 
+# Most files tracked at once; the least recently captured are dropped first
+MAX_STATES = 256
+
+# Files larger than this are backed up to disk instead of kept in memory
+SPILL_THRESHOLD = 64 * 1024
+
+# Block size for the streaming copy+hash of spilled files
+COPY_BLOCK_SIZE = 1024 * 1024
+
+# Most file hashes remembered at once; the least recently used are dropped first
+MAX_HASH_CACHE = 1024
+
+
+def _stat_key(st: os.stat_result) -> tuple:
+    """Identify a file version by mtime, ctime, size and inode."""
+    return (st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino)
+
 
 class FileState:
     """Tracks state of a file for validation."""
@@ -36,37 +57,106 @@ class Interceptor:
     """
     
     def __init__(self):
-        self.states: Dict[str, FileState] = {}
-        self.backup_dir = Path(tempfile.gettempdir()) / "mirrorgate_backups"
-        self.backup_dir.mkdir(exist_ok=True)
+        self.states: "OrderedDict[str, FileState]" = OrderedDict()
+        # path -> ((mtime_ns, ctime_ns, size, ino), sha256) so unchanged files
+        # aren't rehashed. ctime can't be set from userland, so a write that
+        # restores the mtime still misses.
+        self._hash_cache: "OrderedDict[str, Tuple[tuple, str]]" = OrderedDict()
+        # Private (0700) per-interceptor dir: backups hold user file contents
+        self.backup_dir = Path(tempfile.mkdtemp(prefix="mirrorgate_backups-"))
+        self._remove_backup_dir = weakref.finalize(
+            self, shutil.rmtree, str(self.backup_dir), ignore_errors=True
+        )
     
-    def capture_before(self, path: str) -> FileState:
+    def capture_before(self, path: str, capture_content: bool = True) -> FileState:
         """
         Capture file state before a write.
         
         Args:
             path: Path to the file
+            capture_content: Keep a copy of the file for revert(). Audit-only
+                callers that never revert can pass False to just hash it.
             
         Returns:
             FileState object with hash_before set
         """
         state = FileState(path)
         
-        if os.path.exists(path):
-            state.hash_before = compute_file_hash(path)
-            # Store content for potential revert
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        
+        if st is not None and not capture_content:
+            # Hash only; revert() will refuse since there is nothing to restore
+            state.hash_before = self._hash_file(path, st)
+        elif st is not None and st.st_size > SPILL_THRESHOLD:
+            # Large file: copy it to the backup dir rather than holding it
+            state.hash_before = self._spill_to_backup(path, st, state)
+        elif st is not None:
+            # Store content for potential revert, and hash the same bytes.
+            # Unbuffered: FileIO.readall() sizes its buffer from fstat, so this
+            # is one allocation and no intermediate BufferedReader copy.
             try:
-                with open(path, 'rb') as f:
+                with open(path, 'rb', buffering=0) as f:
                     state.content_before = f.read()
-            except:
+            except OSError as e:
+                print(f"Warning: {path} can't be reverted, failed to read it: {e}")
                 state.content_before = None
+            state.hash_before = self._hash_file(path, st, state.content_before)
         else:
             state.hash_before = "NEW_FILE"
             state.content_before = None
         
-        self.states[path] = state
+        self._track(path, state)
         return state
     
+    def _spill_to_backup(self, path: str, st: os.stat_result, state: FileState) -> str:
+        """Copy a file to the backup dir, hashing it in the same pass."""
+        backup_path = self.backup_dir / f"{uuid.uuid4().hex}.bak"
+        h = hashlib.sha256()
+        try:
+            fd = os.open(backup_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            # The fd is owned by dst before the source is opened, so it is
+            # closed even if the source has gone or become unreadable
+            with open(fd, 'wb') as dst, open(path, 'rb', buffering=0) as src:
+                # One reusable buffer: no per-block allocation while copying
+                buf = memoryview(bytearray(COPY_BLOCK_SIZE))
+                while True:
+                    n = src.readinto(buf)
+                    if not n:
+                        break
+                    h.update(buf[:n])
+                    dst.write(buf[:n])
+        except OSError as e:
+            print(f"Warning: {path} can't be reverted, failed to back it up: {e}")
+            backup_path.unlink(missing_ok=True)
+            return self._hash_file(path, st)
+        
+        state.backup_path = str(backup_path)
+        file_hash = h.hexdigest()
+        self._remember_hash(path, st, file_hash)
+        return file_hash
+    
+    def _track(self, path: str, state: FileState):
+        """Record state for a path, evicting the least recently captured."""
+        previous = self.states.pop(path, None)
+        if previous is not None and previous is not state:
+            self._discard_backup(previous)
+        self.states[path] = state
+        while len(self.states) > MAX_STATES:
+            _, evicted = self.states.popitem(last=False)
+            self._discard_backup(evicted)
+    
+    def _discard_backup(self, state: FileState):
+        """Delete a state's on-disk backup, if it has one."""
+        if state.backup_path:
+            try:
+                os.remove(state.backup_path)
+            except OSError:
+                pass
+            state.backup_path = None
+    
     def capture_after(self, path: str) -> FileState:
         """
         Capture file state after a write.
@@ -79,11 +169,58 @@ class Interceptor:
         """
         state = self.states.get(path)
         if not state:
-            state = self.capture_before(path)
+            # No earlier capture: the file already holds the new content, so
+            # copying it would give revert() nothing to restore. Hash only.
+            state = self.capture_before(path, capture_content=False)
+        
+        try:
+            st = os.stat(path)
+        except OSError:
+            state.hash_after = compute_file_hash(path)
+            return state
         
-        state.hash_after = compute_file_hash(path)
+        # Always rehash: hash_after is what the decision record attests to, and
+        # a same-size write inside the timestamp granularity keeps the stat key
+        state.hash_after = self._hash_file(path, st, refresh=True)
         return state
     
+    def _hash_file(
+        self,
+        path: str,
+        st: os.stat_result,
+        content: Optional[bytes] = None,
+        refresh: bool = False
+    ) -> str:
+        """
+        Hash a file, reusing the last hash while its stat key is unchanged.
+        
+        If the file's content has already been read, it is hashed directly
+        instead of reading the file a second time. Content and refresh=True
+        always hash and update the cached entry.
+        """
+        if content is None and not refresh:
+            cached = self._hash_cache.get(path)
+            if cached and cached[0] == _stat_key(st):
+                self._hash_cache.move_to_end(path)
+                return cached[1]
+        
+        if content is not None:
+            file_hash = hashlib.sha256(content).hexdigest()
+        else:
+            file_hash = compute_file_hash(path)
+        if len(file_hash) == 64:  # Don't cache FILE_NOT_FOUND / ERROR markers
+            self._remember_hash(path, st, file_hash)
+        else:
+            self._hash_cache.pop(path, None)
+        return file_hash
+    
+    def _remember_hash(self, path: str, st: os.stat_result, file_hash: str):
+        """Cache a file's hash under its stat key, evicting the least recently used."""
+        self._hash_cache[path] = (_stat_key(st), file_hash)
+        self._hash_cache.move_to_end(path)
+        while len(self._hash_cache) > MAX_HASH_CACHE:
+            self._hash_cache.popitem(last=False)
+    
     def get_new_content(self, path: str) -> Optional[str]:
         """
         Get the new content of a file after write.
@@ -126,6 +263,10 @@ class Interceptor:
                 with open(path, 'wb') as f:
                     f.write(state.content_before)
                 return True
+            elif state.backup_path:
+                # Restore large file from its on-disk backup
+                shutil.copyfile(state.backup_path, path)
+                return True
             else:
                 return False
         except Exception:
@@ -133,5 +274,13 @@ class Interceptor:
     
     def cleanup(self, path: str):
         """Remove tracked state for a path."""
-        if path in self.states:
-            del self.states[path]
+        state = self.states.pop(path, None)
+        if state is not None:
+            self._discard_backup(state)
+    
+    def close(self):
+        """Drop all tracked state and delete the backup directory."""
+        while self.states:
+            _, state = self.states.popitem()
+            self._discard_backup(state)
+        self._remove_backup_dir()
@@ -6,8 +6,8 @@ Connects MirrorGate enforcement to MirrorBrain's write operations.
 All vault writes through MirrorBrain pass through MirrorGate validation.
 """
 
+import os
 import json
-import requests
 from pathlib import Path
 from typing import Tuple, Optional, Dict, Any
 from datetime import datetime, timezone
@@ -15,13 +15,45 @@ from datetime import datetime, timezone
 # MirrorGate imports
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from src.gateway import gateway_write
 from src.crypto import verify_chain, get_previous_hash
 from src.output import log_info, log_error
 
+try:
+    import orjson
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+    _json_loads = orjson.loads
+except ImportError:
+    # Fallback to stdlib json if orjson not available
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+    _json_loads = json.loads
+
 MIRRORGATE_DIR = Path.home() / ".mirrorgate"
 MIRRORBRAIN_STATE = Path.home() / ".mirrordna" / "current_state.json"
 
+# ((inode, mtime_ns, ctime_ns, size), (chain_valid, error, record_count)) of the last
+# verified audit log
+_chain_cache: Optional[Tuple[Tuple[int, int, int, int], Tuple[bool, Optional[str], int]]] = None
+
+# Running block/allow counts for the audit log, and how far into it we've read
+_status_cache: Dict[str, Any] = {
+    "inode": None, "offset": 0, "blocks": 0, "allows": 0, "last_event": None
+}
+
+
+def _count_lines(path: Path) -> int:
+    """Count lines in a file by counting newlines in 1 MiB blocks."""
+    count = 0
+    last_block = b""
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            count += block.count(b"\n")
+            last_block = block
+    if last_block and not last_block.endswith(b"\n"):
+        count += 1  # Final line has no trailing newline
+    return count
+
 
 def mirrorgate_write(content: str, target_path: str, actor: str = "mirrorbrain") -> Tuple[bool, str]:
     """
@@ -38,6 +70,8 @@ def mirrorgate_write(content: str, target_path: str, actor: str = "mirrorbrain")
     Returns:
         Tuple of (success: bool, message: str)
     """
+    # Imported here so health-check-only callers don't load the write path
+    from src.gateway import gateway_write
     return gateway_write(content, target_path)
 
 
@@ -47,13 +81,24 @@ def check_chain_integrity() -> Dict[str, Any]:
     
     Returns status for MirrorBrain health checks.
     """
-    is_valid, error = verify_chain()
-    
+    global _chain_cache
     audit_log = MIRRORGATE_DIR / "audit_log.jsonl"
-    record_count = 0
-    if audit_log.exists():
-        with open(audit_log) as f:
-            record_count = sum(1 for _ in f)
+    try:
+        st = audit_log.stat()
+        # ctime catches in-place edits whose mtime was restored
+        key = (st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+    except OSError:
+        key = None
+    
+    if key is not None and _chain_cache and _chain_cache[0] == key:
+        # Log unchanged since it was last verified
+        is_valid, error, record_count = _chain_cache[1]
+    else:
+        is_valid, error = verify_chain()
+        record_count = 0
+        if key is not None:
+            record_count = _count_lines(audit_log)
+            _chain_cache = (key, (is_valid, error, record_count))
     
     return {
         "chain_valid": is_valid,
@@ -71,24 +116,45 @@ def get_enforcement_status() -> Dict[str, Any]:
     For MirrorBrain state daemon integration.
     """
     audit_log = MIRRORGATE_DIR / "audit_log.jsonl"
-    
-    # Count recent blocks/allows
-    blocks = 0
-    allows = 0
-    last_event = None
-    
-    if audit_log.exists():
-        with open(audit_log) as f:
-            for line in f:
-                try:
-                    record = json.loads(line)
-                    if record.get("action") == "BLOCK":
-                        blocks += 1
-                    else:
-                        allows += 1
-                    last_event = record
-                except:
-                    pass
+    cache = _status_cache
+    
+    try:
+        st = audit_log.stat()
+    except OSError:
+        st = None
+    
+    if st is None or st.st_ino != cache["inode"] or st.st_size < cache["offset"]:
+        # Missing, rotated or truncated log - start counting from scratch
+        cache.update(inode=st.st_ino if st else None, offset=0, blocks=0, allows=0, last_event=None)
+    
+    # Only parse records appended since the last call
+    if st is not None and st.st_size > cache["offset"]:
+        with open(audit_log, 'rb') as f:
+            f.seek(cache["offset"])
+            data = f.read()
+        
+        # Records always end in a newline; leave a partial write for next time
+        end = data.rfind(b"\n") + 1
+        chunk = data[:end]
+        
+        # Parse each new record once; only the top-level "action" counts
+        for line in chunk.splitlines():
+            try:
+                record = _json_loads(line)
+            except ValueError:
+                continue
+            if not isinstance(record, dict):
+                continue
+            if record.get("action") == "BLOCK":
+                cache["blocks"] += 1
+            else:
+                cache["allows"] += 1
+            cache["last_event"] = record
+        cache["offset"] += end
+    
+    blocks = cache["blocks"]
+    allows = cache["allows"]
+    last_event = cache["last_event"]
     
     return {
         "status": "active",
@@ -118,8 +184,11 @@ def register_with_mirrorbrain():
     }
     
     # Write to MirrorBrain integration file
+    # Write to a temp file and rename so readers never see a partial file
     integration_file = MIRRORGATE_DIR / "mirrorbrain_status.json"
-    integration_file.write_text(json.dumps(mirrorgate_state, indent=2))
+    tmp_file = integration_file.with_suffix(".json.tmp")
+    tmp_file.write_bytes(_json_dumps(mirrorgate_state))
+    os.replace(tmp_file, integration_file)
     
     return mirrorgate_state
 
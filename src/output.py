@@ -6,9 +6,11 @@ Demo-ready terminal formatting for video recording.
 Clear visual hierarchy, color-coded decisions, timestamp precision.
 """
 
-from datetime import datetime, timezone
 from typing import Optional
 import shutil
+import sys
+import threading
+import time
 
 # ANSI color codes
 RED = "\033[91m"
@@ -25,15 +27,67 @@ DIM = "\033[2m"
 # Get terminal width
 TERM_WIDTH = shutil.get_terminal_size().columns
 
+# Pre-rendered pieces of the log events (colors and box drawing never change)
+SEPARATOR = f"{GRAY}{'─' * 60}{RESET}"
+_STAMP_FMT = f"{GRAY}[{{ts}}]{RESET} "
+
+_INTERCEPT_FMT = (
+    f"{GRAY}[{{ts}}]{RESET} {YELLOW}▶ INTERCEPT{RESET}\n"
+    f"           │ Agent attempting: {{action}}\n"
+    f"           │ Resource: {WHITE}{{resource}}{RESET}"
+)
+_BLOCK_FMT = (
+    f"           │\n"
+    f"           ╰─▶ {RED}{BOLD}⛔ BLOCKED{RESET}\n"
+    f"               {RED}├─ Violation: {{violation}}{RESET}\n"
+    f"               {RED}├─ Resource: {{resource}}{RESET}\n"
+    f"               {RED}╰─ Action: Write rejected, staging cleared{RESET}"
+)
+_ALLOW_FMT = (
+    f"           │\n"
+    f"           ╰─▶ {GREEN}{BOLD}✅ ALLOWED{RESET}\n"
+    f"               {GREEN}├─ Resource: {{resource}}{RESET}\n"
+    f"               {GREEN}╰─ Action: Write committed{RESET}"
+)
+_RECORD_SIGNED_FMT = (
+    f"           {GRAY}│{RESET}\n"
+    f"           {GRAY}├─ Record signed: {{short_id}}...{RESET}\n"
+    f"           {GRAY}╰─ Chain hash: {{short_hash}}...{RESET}\n"
+)
+
+
+# Serializes events so multi-line blocks from different threads don't interleave
+_write_lock = threading.Lock()
+
+
+def _emit(text: str):
+    """Write one complete log event (plus newline) in a single call."""
+    with _write_lock:
+        sys.stdout.write(text + "\n")
+
+
+# (epoch second, "HH:MM:SS", ISO) - timestamps only change once a second
+_ts_cache = (-1, "", "")
+
+
+def _timestamps() -> tuple:
+    """Return the cached UTC timestamp strings, reformatting on a new second."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        t = time.gmtime(now)
+        _ts_cache = (now, time.strftime("%H:%M:%S", t), time.strftime("%Y-%m-%dT%H:%M:%SZ", t))
+    return _ts_cache
+
 
 def timestamp() -> str:
     """Return current timestamp in clean format."""
-    return datetime.now(timezone.utc).strftime("%H:%M:%S")
+    return _timestamps()[1]
 
 
 def full_timestamp() -> str:
     """Return full ISO timestamp."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return _timestamps()[2]
 
 
 def log_banner():
@@ -48,111 +102,104 @@ def log_banner():
 ║                                                                ║
 ╚══════════════════════════════════════════════════════════════╝{RESET}
 """
-    print(banner)
+    _emit(banner)
 
 
 def log_startup():
     """Log daemon startup."""
     log_banner()
-    print(f"{GRAY}[{timestamp()}]{RESET} ⟡ Daemon initialized")
-    print(f"{GRAY}[{timestamp()}]{RESET} ⟡ Ed25519 keypair loaded")
-    print(f"{GRAY}[{timestamp()}]{RESET} ⟡ Hash chain: ready")
-    print(f"{GRAY}[{timestamp()}]{RESET} ⟡ Audit log: ~/.mirrorgate/audit_log.jsonl")
-    print()
+    stamp = _STAMP_FMT.format(ts=timestamp())
+    _emit(
+        f"{stamp}⟡ Daemon initialized\n"
+        f"{stamp}⟡ Ed25519 keypair loaded\n"
+        f"{stamp}⟡ Hash chain: ready\n"
+        f"{stamp}⟡ Audit log: ~/.mirrorgate/audit_log.jsonl\n"
+    )
 
 
 def log_watching(paths: list):
     """Log the paths being watched."""
-    print(f"{GRAY}[{timestamp()}]{RESET} {CYAN}WATCHING:{RESET}")
+    stamp = _STAMP_FMT.format(ts=timestamp())
+    home = str(__import__('pathlib').Path.home())
+    lines = [f"{stamp}{CYAN}WATCHING:{RESET}"]
     for path in paths:
         # Shorten home path for display
-        display_path = path.replace(str(__import__('pathlib').Path.home()), "~")
-        print(f"           └─ {display_path}")
-    print()
-    print(f"{GRAY}{'─' * 60}{RESET}")
-    print(f"{GRAY}[{timestamp()}]{RESET} {GREEN}● ENFORCEMENT ACTIVE{RESET} — Waiting for writes...")
-    print(f"{GRAY}{'─' * 60}{RESET}")
-    print()
+        lines.append(f"           └─ {path.replace(home, '~')}")
+    lines += [
+        "",
+        SEPARATOR,
+        f"{stamp}{GREEN}● ENFORCEMENT ACTIVE{RESET} — Waiting for writes...",
+        SEPARATOR,
+        "",
+    ]
+    _emit("\n".join(lines))
 
 
 def log_intercept(resource: str, action_type: str = "write"):
     """Log an intercept event."""
-    print(f"{GRAY}[{timestamp()}]{RESET} {YELLOW}▶ INTERCEPT{RESET}")
-    print(f"           │ Agent attempting: {action_type}")
-    print(f"           │ Resource: {WHITE}{resource}{RESET}")
+    _emit(_INTERCEPT_FMT.format(ts=timestamp(), action=action_type, resource=resource))
 
 
 def log_validating():
     """Log that validation is in progress."""
-    print(f"           │ Status: Validating against rules...")
+    _emit(f"           │ Status: Validating against rules...")
 
 
 def log_block(resource: str, violation_code: str):
     """Log a BLOCK decision - prominent red."""
-    print(f"           │")
-    print(f"           ╰─▶ {RED}{BOLD}⛔ BLOCKED{RESET}")
-    print(f"               {RED}├─ Violation: {violation_code}{RESET}")
-    print(f"               {RED}├─ Resource: {resource}{RESET}")
-    print(f"               {RED}╰─ Action: Write rejected, staging cleared{RESET}")
+    _emit(_BLOCK_FMT.format(violation=violation_code, resource=resource))
 
 
 def log_allow(resource: str):
     """Log an ALLOW decision - clean green."""
-    print(f"           │")
-    print(f"           ╰─▶ {GREEN}{BOLD}✅ ALLOWED{RESET}")
-    print(f"               {GREEN}├─ Resource: {resource}{RESET}")
-    print(f"               {GREEN}╰─ Action: Write committed{RESET}")
+    _emit(_ALLOW_FMT.format(resource=resource))
 
 
 def log_record_signed(event_id: str, chain_hash: str):
     """Log that a record was signed."""
-    short_id = event_id[:8]
-    short_hash = chain_hash[:12]
-    print(f"           {GRAY}│{RESET}")
-    print(f"           {GRAY}├─ Record signed: {short_id}...{RESET}")
-    print(f"           {GRAY}╰─ Chain hash: {short_hash}...{RESET}")
-    print()
+    _emit(_RECORD_SIGNED_FMT.format(short_id=event_id[:8], short_hash=chain_hash[:12]))
 
 
 def log_reverted(resource: str):
     """Log that a file was reverted."""
-    print(f"               {YELLOW}└─ File reverted to previous state{RESET}")
+    _emit(f"               {YELLOW}└─ File reverted to previous state{RESET}")
 
 
 def log_separator():
     """Print a visual separator."""
-    print(f"\n{GRAY}{'─' * 60}{RESET}\n")
+    _emit(f"\n{SEPARATOR}\n")
 
 
 def log_shutdown():
     """Log daemon shutdown."""
-    print()
-    print(f"{GRAY}{'─' * 60}{RESET}")
-    print(f"{GRAY}[{timestamp()}]{RESET} ⟡ MirrorGate daemon stopped")
-    print(f"{GRAY}[{timestamp()}]{RESET} ⟡ Audit log preserved")
-    print()
+    stamp = _STAMP_FMT.format(ts=timestamp())
+    _emit(
+        f"\n{SEPARATOR}\n"
+        f"{stamp}⟡ MirrorGate daemon stopped\n"
+        f"{stamp}⟡ Audit log preserved\n"
+    )
 
 
 def log_error(message: str):
     """Log an error."""
-    print(f"{GRAY}[{timestamp()}]{RESET} {RED}ERROR:{RESET} {message}")
+    _emit(f"{_STAMP_FMT.format(ts=timestamp())}{RED}ERROR:{RESET} {message}")
 
 
 def log_info(message: str):
     """Log an info message."""
-    print(f"{GRAY}[{timestamp()}]{RESET} {message}")
+    _emit(f"{_STAMP_FMT.format(ts=timestamp())}{message}")
 
 
 def log_chain_status(total_records: int, last_hash: str):
     """Log chain status."""
     short_hash = last_hash[:16] if last_hash != "GENESIS" else "GENESIS"
-    print(f"{GRAY}[{timestamp()}]{RESET} Chain: {total_records} records, head={short_hash}")
+    _emit(f"{_STAMP_FMT.format(ts=timestamp())}Chain: {total_records} records, head={short_hash}")
 
 
 def log_human_absence():
     """Log that human has left (for demo recording)."""
-    print()
-    print(f"{GRAY}{'─' * 60}{RESET}")
-    print(f"{GRAY}[{timestamp()}]{RESET} {CYAN}◉ HUMAN ABSENT{RESET} — System continues autonomously")
-    print(f"{GRAY}{'─' * 60}{RESET}")
-    print()
+    _emit(
+        f"\n{SEPARATOR}\n"
+        f"{_STAMP_FMT.format(ts=timestamp())}{CYAN}◉ HUMAN ABSENT{RESET} — System continues autonomously\n"
+        f"{SEPARATOR}\n"
+    )
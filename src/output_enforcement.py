@@ -38,28 +38,37 @@ class EnforcementOutput:
 
 
 # Forbidden patterns that require blocking
-FORBIDDEN_PATTERNS = [
+FORBIDDEN_PATTERNS = (
     (r"(?i)(api[_\s]?key|secret[_\s]?key|password)\s*[:=]\s*['\"][^'\"]{8,}['\"]", "credential_leak"),
     (r"(?i)rm\s+-rf\s+/", "dangerous_command"),
     (r"(?i)(sudo|chmod\s+777|eval\s*\()", "system_risk"),
-]
+)
 
 # Patterns that require rewriting (advice/authority language)
-ADVICE_PATTERNS = [
+ADVICE_PATTERNS = (
     (r"(?i)\byou\s+should\b", "should"),
     (r"(?i)\byou\s+must\b", "must"),
     (r"(?i)\byou\s+need\s+to\b", "need_to"),
     (r"(?i)\bI\s+recommend\b", "recommend"),
     (r"(?i)\bI\s+advise\b", "advise"),
     (r"(?i)\bthe\s+right\s+(way|approach)\b", "prescriptive"),
-]
+)
 
 # Overconfidence patterns
-OVERCONFIDENCE_PATTERNS = [
+OVERCONFIDENCE_PATTERNS = (
     (r"(?i)\b(definitely|certainly|absolutely|always|never|guaranteed)\b", "certainty"),
     (r"(?i)\b(100%|absolutely\s+sure|without\s+doubt)\b", "absolute"),
     (r"(?i)\b(the\s+best|the\s+only|the\s+correct)\b", "superlative"),
-]
+)
+
+# Literal substrings (lowercase), one of which every default pattern in the
+# matching table needs. Output containing none of them skips that pass.
+FORBIDDEN_HINTS = ("key", "password", "rm", "sudo", "chmod", "eval")
+ADVICE_HINTS = ("should", "must", "need", "recommend", "advise", "right")
+OVERCONFIDENCE_HINTS = (
+    "definitely", "certainly", "absolutely", "always", "never", "guaranteed",
+    "100%", "doubt", "best", "only", "correct",
+)
 
 # Hedging replacements
 HEDGES = {
@@ -83,6 +92,60 @@ HEDGES = {
     "the correct": "an appropriate",
 }
 
+# All hedge phrases in one pass. Longest first so "absolutely sure" wins over
+# "absolutely"; lookarounds instead of \b so "100%" still matches.
+HEDGE_RE = re.compile(
+    r"(?<!\w)(?:" + "|".join(re.escape(k) for k in sorted(HEDGES, key=len, reverse=True)) + r")(?!\w)",
+    re.IGNORECASE,
+)
+HEDGE_MAP = {k.lower(): v for k, v in HEDGES.items()}
+
+
+def _combine_patterns(patterns) -> Optional[re.Pattern]:
+    """
+    Join (pattern, name) pairs into a single alternation.
+    
+    A leading (?i) becomes a scoped (?i:...) group so flags don't leak
+    between alternatives. Returns None if the patterns can't be combined
+    safely (numbered backreferences, duplicate group names, other global
+    flags); callers then just run the individual patterns.
+    """
+    parts = []
+    for p, _ in patterns:
+        if re.search(r"\\[1-9]", p):
+            return None
+        if p.startswith("(?i)"):
+            parts.append(f"(?i:{p[4:]})")
+        else:
+            parts.append(f"(?:{p})")
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
+
+
+def _ascii_lower(text: str) -> Optional[str]:
+    """
+    Lowercase text for the substring prefilters.
+    
+    Returns None for non-ASCII text: re's case-insensitive matching folds a
+    few non-ASCII letters (e.g. "ſ") that str.lower() leaves alone, so the
+    prefilter can't be trusted there.
+    """
+    return text.lower() if text.isascii() else None
+
+
+def _has_hint(lowered: Optional[str], hints: Optional[Tuple[str, ...]]) -> bool:
+    """True if a pass might match: no prefilter applies, or a hint is present."""
+    if lowered is None or hints is None:
+        return True
+    return any(hint in lowered for hint in hints)
+
+
+def _any_match(combined: Optional[re.Pattern], text: str) -> bool:
+    """True if the combined pattern matches, or if there is none to check."""
+    return combined is None or combined.search(text) is not None
+
 
 class OutputEnforcement:
     """
@@ -103,6 +166,22 @@ class OutputEnforcement:
         self._forbidden_compiled = [(re.compile(p), name) for p, name in self.forbidden]
         self._advice_compiled = [(re.compile(p), name) for p, name in self.advice]
         self._overconfidence_compiled = [(re.compile(p), name) for p, name in self.overconfidence]
+        
+        # One alternation per pass: a single scan tells us whether any pattern
+        # in the pass can match, so clean output skips the per-pattern loop
+        self._forbidden_any = _combine_patterns(self.forbidden)
+        self._advice_any = _combine_patterns(self.advice)
+        self._overconfidence_any = _combine_patterns(self.overconfidence)
+        self._violation_any = _combine_patterns(
+            list(self.forbidden) + list(self.advice) + list(self.overconfidence)
+        )
+        
+        # Hints only describe the default tables; custom patterns always run
+        self._forbidden_hints = FORBIDDEN_HINTS if self.forbidden is FORBIDDEN_PATTERNS else None
+        self._advice_hints = ADVICE_HINTS if self.advice is ADVICE_PATTERNS else None
+        self._overconfidence_hints = (
+            OVERCONFIDENCE_HINTS if self.overconfidence is OVERCONFIDENCE_PATTERNS else None
+        )
     
     def enforce(self, output: str, mode: str = "TRANSACTIONAL") -> EnforcementOutput:
         """
@@ -120,23 +199,43 @@ class OutputEnforcement:
         violations = []
         rewrites = 0
         
+        # Lowercased once for the substring prefilters of every pass
+        lowered = _ascii_lower(current)
+        
+        # Clean output needs none of the passes: either no hint substring is
+        # present, or one scan of the union of every table finds nothing
+        hinted = (
+            _has_hint(lowered, self._forbidden_hints)
+            or _has_hint(lowered, self._advice_hints)
+            or _has_hint(lowered, self._overconfidence_hints)
+        )
+        if not hinted or not _any_match(self._violation_any, current):
+            return EnforcementOutput(
+                result=EnforcementResult.PASS,
+                output=current,
+                original=original,
+                metadata={"mode": mode}
+            )
+        
         # Pass 1: Forbidden patterns (blocking)
-        for pattern, name in self._forbidden_compiled:
-            if pattern.search(current):
-                violations.append(f"forbidden:{name}")
-                return EnforcementOutput(
-                    result=EnforcementResult.BLOCK,
-                    output=FALLBACK_RESPONSE,
-                    original=original,
-                    violations=violations,
-                    metadata={"blocked_at": "pass1", "pattern": name}
-                )
+        if _has_hint(lowered, self._forbidden_hints) and _any_match(self._forbidden_any, current):
+            for pattern, name in self._forbidden_compiled:
+                if pattern.search(current):
+                    violations.append(f"forbidden:{name}")
+                    return EnforcementOutput(
+                        result=EnforcementResult.BLOCK,
+                        output=FALLBACK_RESPONSE,
+                        original=original,
+                        violations=violations,
+                        metadata={"blocked_at": "pass1", "pattern": name}
+                    )
         
         # Pass 2: Advice/authority language (rewrite)
         advice_violations = []
-        for pattern, name in self._advice_compiled:
-            if pattern.search(current):
-                advice_violations.append(f"advice:{name}")
+        if _has_hint(lowered, self._advice_hints) and _any_match(self._advice_any, current):
+            for pattern, name in self._advice_compiled:
+                if pattern.search(current):
+                    advice_violations.append(f"advice:{name}")
         
         if advice_violations:
             violations.extend(advice_violations)
@@ -157,9 +256,13 @@ class OutputEnforcement:
         
         # Pass 3: Overconfidence (rewrite)
         overconf_violations = []
-        for pattern, name in self._overconfidence_compiled:
-            if pattern.search(current):
-                overconf_violations.append(f"overconfidence:{name}")
+        if current is not original:
+            lowered = _ascii_lower(current)
+        if (_has_hint(lowered, self._overconfidence_hints)
+                and _any_match(self._overconfidence_any, current)):
+            for pattern, name in self._overconfidence_compiled:
+                if pattern.search(current):
+                    overconf_violations.append(f"overconfidence:{name}")
         
         if overconf_violations:
             violations.extend(overconf_violations)
@@ -196,24 +299,26 @@ class OutputEnforcement:
         )
     
     def _apply_hedging(self, text: str) -> Tuple[str, int]:
-        """Apply hedging replacements to text."""
+        """Apply hedging replacements to text in a single scan."""
         count = 0
-        result = text
-        
-        for original, replacement in HEDGES.items():
-            # Case-insensitive replacement
-            pattern = re.compile(re.escape(original), re.IGNORECASE)
-            matches = pattern.findall(result)
-            if matches:
-                for match in matches:
-                    # Preserve original case for first letter
-                    if match[0].isupper():
-                        rep = replacement[0].upper() + replacement[1:]
-                    else:
-                        rep = replacement
-                    result = pattern.sub(rep, result, count=1)
-                    count += 1
         
+        def hedge(match: re.Match) -> str:
+            nonlocal count
+            count += 1
+            phrase = match.group(0)
+            replacement = HEDGE_MAP.get(phrase.lower())
+            if replacement is None:
+                # re's case folding matched a non-ASCII lookalike (e.g. "ſ")
+                replacement = next(
+                    v for k, v in HEDGES.items()
+                    if re.fullmatch(re.escape(k), phrase, re.IGNORECASE)
+                )
+            # Preserve original case for first letter
+            if phrase[0].isupper():
+                return replacement[0].upper() + replacement[1:]
+            return replacement
+        
+        result = HEDGE_RE.sub(hedge, text)
         return result, count
     
     def _has_violations(self, text: str, patterns: List[Tuple]) -> bool:
@@ -14,6 +14,18 @@ from .consent_manager import ConsentManager, PermissionScope, PermissionAction,
 from .rule_engine import RuleEngine
 from .tripwires import TripwireSystem, ActionRecord, TripwireEvent
 
+try:
+    from .pulse.audit import flush as flush_pulse_audit
+except ImportError:
+    flush_pulse_audit = None
+
+
+# Value -> member tables so hot-path coercion is a dict probe rather than
+# Enum.__call__ plus a ValueError on bad input
+_SCOPES = {member.value: member for member in PermissionScope}
+_ACTIONS = {member.value: member for member in PermissionAction}
+_CONTEXTS = {member.value: member for member in ContextMode}
+
 
 class OversightIntegration:
     """
@@ -26,17 +38,20 @@ class OversightIntegration:
         self.rule_engine = RuleEngine()
         self.tripwires = TripwireSystem()
         
-        # Session context
+        # Session context (the .value string is kept alongside the enum)
         self.current_context: ContextMode = ContextMode.NULL
+        self.current_context_value: str = ContextMode.NULL.value
         self.action_count: int = 0
         self.session_start: datetime = datetime.now(timezone.utc)
+        self._session_start_iso: str = self.session_start.isoformat()
     
     def set_context(self, mode: str):
         """Set the current context mode."""
-        try:
-            self.current_context = ContextMode(mode)
-        except ValueError:
-            self.current_context = ContextMode.NULL
+        if isinstance(mode, ContextMode):
+            self.current_context = mode
+        else:
+            self.current_context = _CONTEXTS.get(mode, ContextMode.NULL)
+        self.current_context_value = self.current_context.value
     
     def check_permission(
         self,
@@ -55,10 +70,10 @@ class OversightIntegration:
                 "escalation_required": bool
             }
         """
-        try:
-            scope_enum = PermissionScope(scope)
-            action_enum = PermissionAction(action)
-        except ValueError:
+        # Members are accepted as-is, as PermissionScope(member) would
+        scope_enum = scope if isinstance(scope, PermissionScope) else _SCOPES.get(scope)
+        action_enum = action if isinstance(action, PermissionAction) else _ACTIONS.get(action)
+        if scope_enum is None or action_enum is None:
             return {
                 "allowed": False,
                 "reason": f"Invalid scope or action: {scope}/{action}",
@@ -110,7 +125,7 @@ class OversightIntegration:
         triggered_rules = self.rule_engine.evaluate_rules(
             action=action,
             content=content,
-            context=self.current_context.value,
+            context=self.current_context_value,
             frequency_context={"action_count": self.action_count}
         )
         
@@ -156,10 +171,10 @@ class OversightIntegration:
     def get_status(self) -> Dict[str, Any]:
         """Get current oversight status summary."""
         return {
-            "context": self.current_context.value,
-            "session_start": self.session_start.isoformat(),
+            "context": self.current_context_value,
+            "session_start": self._session_start_iso,
             "action_count": self.action_count,
-            "permissions_active": len(self.consent_manager.list_permissions()),
+            "permissions_active": self.consent_manager.count_permissions(),
             "rules_loaded": len(self.rule_engine.list_rules()),
             "tripwire_configs": len(self.tripwires.configs)
         }
@@ -171,6 +186,10 @@ class OversightIntegration:
         
         # Save tripwire baseline
         self.tripwires.save_baseline()
+        
+        # Wait for queued pulse audit events; raises OSError if any were lost
+        if flush_pulse_audit is not None:
+            flush_pulse_audit()
 
 
 # Singleton instance for easy import
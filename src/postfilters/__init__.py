@@ -40,6 +40,14 @@ POSTFILTERS: List[Callable[[str, str], PostfilterResult]] = [
     check_identity_claims,
 ]
 
+# Filters that unconditionally return ALLOWED in a mode; skipped up front
+# rather than called. Any other mode behaves like TRANSACTIONAL.
+_MODE_NOOPS = {
+    "PLAY": frozenset({check_prescriptive, check_uncertainty}),
+    "REFLECTIVE": frozenset(),
+    "TRANSACTIONAL": frozenset({check_uncertainty}),
+}
+
 
 def run_postfilters(output: str, mode: str = "TRANSACTIONAL") -> Dict[str, Any]:
     """
@@ -61,7 +69,11 @@ def run_postfilters(output: str, mode: str = "TRANSACTIONAL") -> Dict[str, Any]:
     rewrites = 0
     all_violations = []
     
+    skip = _MODE_NOOPS.get(mode, _MODE_NOOPS["TRANSACTIONAL"])
+    
     for filter_func in POSTFILTERS:
+        if filter_func in skip:
+            continue
         result = filter_func(current_output, mode)
         
         if result.outcome == PostfilterOutcome.REFUSED:
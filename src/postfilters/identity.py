@@ -7,7 +7,7 @@ Detects and blocks false identity/capability claims.
 import re
 
 
-IDENTITY_PATTERNS = [
+IDENTITY_PATTERNS = (
     (r"(?i)\bI\s+am\s+(Claude|GPT|ChatGPT|Gemini|Bard)\b", "false_identity"),
     (r"(?i)\bI\s+can\s+access\s+the\s+internet\b", "false_capability_internet"),
     (r"(?i)\bI\s+can\s+see\s+your\s+screen\b", "false_capability_screen"),
@@ -15,7 +15,9 @@ IDENTITY_PATTERNS = [
     (r"(?i)\bI\s+am\s+conscious\b", "false_claim_consciousness"),
     (r"(?i)\bI\s+have\s+feelings\b", "false_claim_feelings"),
     (r"(?i)\bI\s+remember\s+our\s+last\s+conversation\b", "false_claim_memory"),
-]
+)
+
+_COMPILED = tuple((re.compile(pattern), name) for pattern, name in IDENTITY_PATTERNS)
 
 
 def check_identity_claims(output: str, mode: str = "TRANSACTIONAL"):
@@ -28,8 +30,8 @@ def check_identity_claims(output: str, mode: str = "TRANSACTIONAL"):
     
     violations = []
     
-    for pattern, name in IDENTITY_PATTERNS:
-        if re.search(pattern, output):
+    for compiled, name in _COMPILED:
+        if compiled.search(output):
             violations.append(f"identity:{name}")
     
     if violations:
@@ -14,7 +14,7 @@ def _get_result_class():
     return PostfilterResult, PostfilterOutcome
 
 
-PRESCRIPTIVE_PATTERNS = [
+PRESCRIPTIVE_PATTERNS = (
     (r"(?i)\byou\s+should\b", "you should"),
     (r"(?i)\byou\s+must\b", "you must"),
     (r"(?i)\bthe\s+best\s+option\s+is\b", "the best option is"),
@@ -22,7 +22,7 @@ PRESCRIPTIVE_PATTERNS = [
     (r"(?i)\bI\s+recommend\b", "I recommend"),
     (r"(?i)\byou\s+need\s+to\b", "you need to"),
     (r"(?i)\bI\s+advise\b", "I advise"),
-]
+)
 
 REPLACEMENTS = {
     "you should": "you might consider",
@@ -34,6 +34,17 @@ REPLACEMENTS = {
     "I advise": "a possible path is",
 }
 
+# Compiled once at import; the combined alternation tags each hit with the
+# index of the pattern it came from so one pass can rewrite every phrase.
+_COMPILED = tuple(re.compile(pattern) for pattern, _ in PRESCRIPTIVE_PATTERNS)
+_COMBINED = re.compile(
+    "|".join(
+        f"(?P<g{i}>{pattern[len('(?i)'):]})"
+        for i, (pattern, _) in enumerate(PRESCRIPTIVE_PATTERNS)
+    ),
+    re.IGNORECASE,
+)
+
 
 def check_prescriptive(output: str, mode: str = "TRANSACTIONAL"):
     """
@@ -50,28 +61,29 @@ def check_prescriptive(output: str, mode: str = "TRANSACTIONAL"):
             filter_name="prescriptive"
         )
     
-    violations = []
-    current = output
-    
-    for pattern, name in PRESCRIPTIVE_PATTERNS:
-        if re.search(pattern, current):
-            violations.append(f"prescriptive:{name}")
-    
+    # Per-pattern searches are cheaper than the combined alternation on
+    # clean text, so only fall through to the rewrite pass on a hit.
+    if not any(compiled.search(output) for compiled in _COMPILED):
+        return PostfilterResult(
+            outcome=PostfilterOutcome.ALLOWED,
+            output=output,
+            filter_name="prescriptive"
+        )
+
+    hits = set()
+
+    def _replace(m):
+        index = int(m.lastgroup[1:])
+        hits.add(index)
+        replacement = REPLACEMENTS[PRESCRIPTIVE_PATTERNS[index][1]]
+        if m.group()[0].islower():
+            return replacement
+        return replacement[0].upper() + replacement[1:]
+
+    rewritten = _COMBINED.sub(_replace, output)
+    violations = [f"prescriptive:{PRESCRIPTIVE_PATTERNS[i][1]}" for i in sorted(hits)]
+
     if violations:
-        # Apply replacements
-        rewritten = output
-        for pattern, name in PRESCRIPTIVE_PATTERNS:
-            if name in REPLACEMENTS:
-                # Case-insensitive replacement
-                replacement = REPLACEMENTS[name]
-                rewritten = re.sub(
-                    pattern, 
-                    lambda m: replacement if m.group()[0].islower() 
-                        else replacement[0].upper() + replacement[1:],
-                    rewritten,
-                    count=0
-                )
-        
         return PostfilterResult(
             outcome=PostfilterOutcome.REWRITTEN,
             output=rewritten,
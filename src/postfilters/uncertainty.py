@@ -7,7 +7,7 @@ Ensures markers of epistemic humility in REFLECTIVE mode.
 import re
 
 
-UNCERTAINTY_MARKERS = [
+UNCERTAINTY_MARKERS = (
     "perhaps",
     "possible",
     "possibly",
@@ -23,7 +23,7 @@ UNCERTAINTY_MARKERS = [
     "likely",
     "probably",
     "⟡",
-]
+)
 
 
 def check_uncertainty(output: str, mode: str = "TRANSACTIONAL"):
@@ -1,16 +1,84 @@
+import os
+import sys
 import json
+import time
+import queue
+import atexit
 import hashlib
 import base64
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Any, Dict
-from .types import PulseEvent
+from .types import PulseEvent, event_signing_json
+
+try:
+    import uuid6
+    def uuid_gen(): return str(uuid6.uuid7())
+except ImportError:
+    import uuid
+    def uuid_gen(): return str(uuid.uuid4())
 
 # MirrorGate Standard Paths
 MIRRORGATE_DIR = Path.home() / ".mirrorgate"
 PULSE_LOG = MIRRORGATE_DIR / "pulse_audit.jsonl"
 PULSE_CHAIN_STATE = MIRRORGATE_DIR / "pulse_chain_state.json"
 
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    """Read an integer knob from the environment, warning and using the default if it's invalid."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = minimum - 1
+    if number < minimum:
+        print(f"Warning: invalid {name} {value!r}, using {default}", file=sys.stderr)
+        return default
+    return number
+
+# Writer batching: at most LOG_BUFFER_SIZE events per write, waiting up to
+# LOG_BUFFER_TIME_MS for a burst to fill the batch.
+LOG_BUFFER_SIZE = _env_int("PULSE_LOG_BUFFER_SIZE", 64, minimum=1)
+LOG_BUFFER_TIME_MS = _env_int("PULSE_LOG_BUFFER_TIME_MS", 50, minimum=0)
+MAX_PENDING_EVENTS = 1024
+
+# Durability of the log, in the style of commitlog_sync:
+#   "all"          fsync after every batch
+#   "periodic:N"   fsync at most every N ms (and on exit)
+#   "none"         leave it to the OS
+DEFAULT_SYNC_MODE = "periodic:1000"
+PULSE_SYNC_MODE = os.environ.get("PULSE_SYNC_MODE", DEFAULT_SYNC_MODE)
+
+
+def _parse_sync_mode(mode: str) -> Optional[float]:
+    """Return the fsync interval in seconds, 0 for every batch or None for never.
+
+    An unrecognised mode warns and falls back to DEFAULT_SYNC_MODE rather than
+    failing the import (and with it every pulse command).
+    """
+    if mode == "all":
+        return 0.0
+    if mode == "none":
+        return None
+    if mode.startswith("periodic:"):
+        value = mode[len("periodic:"):]
+        if value.endswith("ms"):
+            value = value[:-2]
+        try:
+            interval = int(value)
+        except ValueError:
+            interval = -1
+        if interval >= 0:
+            return interval / 1000
+    print(
+        f"Warning: unknown PULSE_SYNC_MODE {mode!r}, using {DEFAULT_SYNC_MODE!r}",
+        file=sys.stderr,
+    )
+    return _parse_sync_mode(DEFAULT_SYNC_MODE)
+
 try:
     from ..crypto import load_private_key
 except (ImportError, ValueError):
@@ -20,12 +88,43 @@ except (ImportError, ValueError):
         def load_private_key(): raise NotImplementedError("Crypto not found")
 
 
+# Events are hashed and signed in order under _chain_lock, then handed to a
+# background writer as (line, chain_hash, generation). _last_hash is the hash
+# of the last event queued; while it differs from the last one written, it is
+# ahead of the state file and is the chain head. Otherwise the state file is
+# read, so events logged by other processes are chained onto.
+_chain_lock = threading.Lock()
+_last_hash: Optional[str] = None
+_generation = 0
+# Set by the writer: (hash of the last event it wrote, whether the state file
+# was updated to it), the error that lost a batch, and that batch's generation.
+# The rest of a failed generation chains onto the lost events, so it is
+# dropped; the next log/flush call raises the error and starts a new
+# generation from the last hash actually written.
+_written: tuple = (None, True)
+_write_error: Optional[BaseException] = None
+_failed_generation: Optional[int] = None
+_queue: "queue.Queue" = queue.Queue(maxsize=MAX_PENDING_EVENTS)
+_writer: Optional[threading.Thread] = None
+_sync_interval = _parse_sync_mode(PULSE_SYNC_MODE)
+_last_sync = 0.0
+_unsynced = False
+# Append handle kept open across batches; _log_lock guards it and the sync
+# state. _log_id is the (path, inode) it was opened for.
+_log_lock = threading.Lock()
+_log_fh = None
+_log_id: Optional[tuple] = None
+
 def ensure_directories():
     MIRRORGATE_DIR.mkdir(exist_ok=True)
 
 def get_previous_hash() -> str:
-    if not PULSE_CHAIN_STATE.exists():
-        return "GENESIS"
+    if _last_hash is not None and _last_hash != _written[0]:
+        # Events still queued are ahead of the state file
+        return _last_hash
+    written_hash, state_saved = _written
+    if not state_saved:
+        return written_hash
     try:
         state = json.loads(PULSE_CHAIN_STATE.read_text())
         return state.get("last_hash", "GENESIS")
@@ -34,10 +133,171 @@ def get_previous_hash() -> str:
 
 def save_chain_state(last_hash: str):
     ensure_directories()
-    PULSE_CHAIN_STATE.write_text(json.dumps({
+    # Per-process temp name, so concurrent writers can't clobber each other's
+    tmp = PULSE_CHAIN_STATE.with_suffix(f".json.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({
         "last_hash": last_hash,
         "updated": datetime.now(timezone.utc).isoformat()
     }))
+    os.replace(tmp, PULSE_CHAIN_STATE)
+
+def _fsync_locked():
+    global _last_sync, _unsynced
+    if _unsynced and _log_fh is not None:
+        os.fsync(_log_fh.fileno())
+        _last_sync = time.monotonic()
+        _unsynced = False
+
+def _sync_log():
+    """fsync the pulse log if anything has been written since the last sync."""
+    with _log_lock:
+        _fsync_locked()
+
+def _close_log_locked():
+    global _log_fh, _log_id
+    if _log_fh is not None:
+        try:
+            if _sync_interval is not None:
+                _fsync_locked()
+        finally:
+            _log_fh.close()
+            _log_fh = _log_id = None
+
+def _log_handle_locked():
+    """Return the open log handle, reopening if PULSE_LOG moved or was rotated."""
+    global _log_fh, _log_id
+    try:
+        current = (str(PULSE_LOG), os.stat(PULSE_LOG).st_ino)
+    except FileNotFoundError:
+        current = None
+    if _log_fh is None or current != _log_id:
+        _close_log_locked()
+        # Unbuffered, so a failed write can't leave lines behind to be flushed later
+        _log_fh = open(PULSE_LOG, 'ab', buffering=0)
+        _log_id = (str(PULSE_LOG), os.fstat(_log_fh.fileno()).st_ino)
+    return _log_fh
+
+def _sync_due_in() -> Optional[float]:
+    """Seconds until a periodic fsync is due, or None if none is pending."""
+    if not _unsynced or not _sync_interval:
+        return None
+    return max(0.0, _last_sync + _sync_interval - time.monotonic())
+
+def _record_loss(error: BaseException, batch):
+    """Remember that a batch never reached the log, for dropping and reporting."""
+    global _write_error, _failed_generation
+    _failed_generation = batch[-1][2]
+    with _log_lock:
+        _write_error = error
+    print(f"Warning: pulse audit lost {len(batch)} event(s): {error}", file=sys.stderr)
+
+def _write_batch(batch):
+    """Append a batch of (line, chain_hash, generation) entries and advance the chain state."""
+    global _unsynced, _written
+    # Entries from a failed generation chain onto a lost event; drop them
+    batch = [entry for entry in batch if entry[2] != _failed_generation]
+    if not batch:
+        return
+    
+    data = "".join(line for line, _, _ in batch).encode('utf-8')
+    try:
+        ensure_directories()
+        with _log_lock:
+            f = _log_handle_locked()
+            view = memoryview(data)
+            while view:
+                view = view[f.write(view):]
+            _unsynced = True
+    except Exception as e:
+        with _log_lock:
+            try:
+                _close_log_locked()
+            except OSError:
+                pass
+        _record_loss(e, batch)
+        return
+    
+    # The events are in the log now; failures below don't lose them
+    last_hash = batch[-1][1]
+    try:
+        if _sync_interval == 0 or (_sync_interval is not None and _sync_due_in() == 0):
+            _sync_log()
+        save_chain_state(last_hash)
+        _written = (last_hash, True)
+    except Exception as e:
+        _written = (last_hash, False)
+        print(f"Warning: pulse audit state update failed: {e}", file=sys.stderr)
+
+def _writer_loop():
+    while True:
+        try:
+            # Wake up for a pending periodic fsync even if traffic stops
+            batch = [_queue.get(timeout=_sync_due_in())]
+        except queue.Empty:
+            try:
+                _sync_log()
+            except Exception as e:
+                print(f"Warning: pulse audit sync failed: {e}", file=sys.stderr)
+            continue
+        deadline = time.monotonic() + LOG_BUFFER_TIME_MS / 1000
+        while len(batch) < LOG_BUFFER_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(_queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        try:
+            _write_batch(batch)
+        except Exception as e:
+            # Never let the writer die: the queue must keep draining
+            _record_loss(e, batch)
+        finally:
+            for _ in batch:
+                _queue.task_done()
+
+def _ensure_writer():
+    global _writer
+    if _writer is None:
+        _writer = threading.Thread(target=_writer_loop, name="pulse-audit-writer", daemon=True)
+        _writer.start()
+
+def _raise_write_error_locked():
+    """
+    Raise (once) if the writer lost events, starting a new generation from
+    the last hash written. Called with _chain_lock held.
+    """
+    global _write_error, _last_hash, _generation
+    with _log_lock:
+        error, _write_error = _write_error, None
+    if error is not None:
+        _last_hash = None
+        _generation += 1
+        raise OSError(f"pulse audit write failed: {error}") from error
+
+def flush():
+    """
+    Block until every queued pulse event has been written (and synced, unless mode is none).
+    
+    Raises OSError if any queued event could not be written.
+    """
+    if _writer is not None:
+        _queue.join()
+        if _sync_interval is not None:
+            _sync_log()
+        with _chain_lock:
+            _raise_write_error_locked()
+
+def _shutdown():
+    try:
+        flush()
+    except OSError as e:
+        print(f"Warning: {e}", file=sys.stderr)
+    with _log_lock:
+        _close_log_locked()
+
+atexit.register(_shutdown)
 
 def log_pulse_event(
     event_type: str,
@@ -46,7 +306,11 @@ def log_pulse_event(
 ) -> PulseEvent:
     """
     Log a generic Pulse event with hash chaining.
+    
+    Raises OSError, without logging the event, if earlier events could not
+    be written; the chain then resumes from the last hash on disk.
     """
+    global _last_hash
     ensure_directories()
     
     # 1. Prepare Basic Event
@@ -57,48 +321,46 @@ def log_pulse_event(
     payload_str = json.dumps(payload, sort_keys=True)
     payload_hash = hashlib.sha256(payload_str.encode()).hexdigest()
     
-    prev_hash = get_previous_hash()
-    
-    # Create Event Object (Unsigned first)
-    # Note: PulseEvent has 'event_id', 'ts', 'type', 'payload_hash', 'prev_hash', 'signature'
-    
     # We need an ID.
-    try:
-        import uuid6
-        eid = str(uuid6.uuid7())
-    except:
-        import uuid
-        eid = str(uuid.uuid4())
-        
-    event = PulseEvent(
-        event_id=eid,
-        ts=datetime.now(timezone.utc),
-        type=event_type,
-        payload_hash=payload_hash,
-        prev_hash=prev_hash,
-        signature=None
-    )
-    
-    # 2. Compute Chain Hash (this serves as the "content to be signed")
-    # serialization for hashing
-    event_json = event.model_dump_json(exclude={'signature'}, exclude_none=True)
+    eid = uuid_gen()
     
-    # Chain Input = EventJSON + PrevHash?
-    # The 'prev_hash' is already INSIDE the EventJSON.
-    # So hashing the EventJSON is sufficient to bind it to the chain.
-    chain_hash = hashlib.sha256(event_json.encode()).hexdigest()
-    
-    # 3. Sign the Chain Hash
-    private_key = load_private_key()
-    signature_bytes = private_key.sign(chain_hash.encode())
-    event.signature = base64.b64encode(signature_bytes).decode()
-    
-    # 4. Persist
-    # We append the FULL event (including signature) to the log
-    with open(PULSE_LOG, 'a') as f:
-        f.write(event.model_dump_json() + '\n')
+    with _chain_lock:
+        _raise_write_error_locked()
+        prev_hash = get_previous_hash()
+        
+        # Create Event Object (Unsigned first)
+        # Note: PulseEvent has 'event_id', 'ts', 'type', 'payload_hash', 'prev_hash', 'signature'
+        event = PulseEvent(
+            event_id=eid,
+            ts=datetime.now(timezone.utc),
+            type=event_type,
+            payload_hash=payload_hash,
+            prev_hash=prev_hash,
+            signature=None
+        )
+        
+        # 2. Compute Chain Hash (this serves as the "content to be signed")
+        # serialization for hashing
+        event_json = event_signing_json(event)
+        
+        # Chain Input = EventJSON + PrevHash?
+        # The 'prev_hash' is already INSIDE the EventJSON.
+        # So hashing the EventJSON is sufficient to bind it to the chain.
+        chain_hash = hashlib.sha256(event_json.encode()).hexdigest()
+        
+        # 3. Sign the Chain Hash
+        private_key = load_private_key()
+        signature_bytes = private_key.sign(chain_hash.encode())
+        event.signature = base64.b64encode(signature_bytes).decode()
         
-    # 5. Update State
-    save_chain_state(chain_hash)
+        # 4. Persist
+        # The FULL event (including signature) is queued for the writer in
+        # chain order; it appends the log and then updates the state file.
+        # signature is the last field, so the full JSON is the hashed JSON
+        # with it appended - no second serialization needed.
+        line = f'{event_json[:-1]},"signature":"{event.signature}"}}\n'
+        _ensure_writer()
+        _queue.put((line, chain_hash, _generation))
+        _last_hash = chain_hash
     
     return event
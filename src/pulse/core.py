@@ -24,7 +24,7 @@ except (ImportError, ValueError):
         KEYS_DIR = Path(".") # Mock
 
 
-from .types import PulseToken, PulseScope, TokenConstraints
+from .types import PulseToken, PulseScope, TokenConstraints, token_signing_json
 try:
     import uuid6
     def uuid_gen(): return str(uuid6.uuid7())
@@ -32,15 +32,26 @@ except ImportError:
     import uuid
     def uuid_gen(): return str(uuid.uuid4())
 
+# Bound on remembered (payload, signature) pairs that already verified
+VERIFIED_CACHE_SIZE = 1024
+
 class PulseCore:
     def __init__(self):
         self._private_key = None
+        self._public_key = None
+        # Keyed on the exact signed bytes, so an edited token never hits
+        self._verified = set()
 
     def _get_key(self):
         if not self._private_key:
             self._private_key = load_private_key()
         return self._private_key
 
+    def _get_public_key(self):
+        if not self._public_key:
+            self._public_key = self._get_key().public_key()
+        return self._public_key
+
     def issue_token(self, 
                     issued_to: str, 
                     scopes: List[PulseScope], 
@@ -64,12 +75,17 @@ class PulseCore:
         
         # Sign the token content
         # We sign the canonical JSON representation of the token (excluding signature)
-        payload = token.model_dump_json(exclude={'signature'}, exclude_none=True)
+        payload = token_signing_json(token)
         
         private_key = self._get_key()
         signature_bytes = private_key.sign(payload.encode('utf-8'))
         token.signature = base64.b64encode(signature_bytes).decode('utf-8')
         
+        # We just produced this signature, so it needs no Ed25519 verify later
+        if len(self._verified) >= VERIFIED_CACHE_SIZE:
+            self._verified.clear()
+        self._verified.add((payload.encode('utf-8'), token.signature))
+        
         return token
 
     def verify_token(self, token: PulseToken) -> bool:
@@ -88,11 +104,19 @@ class PulseCore:
 
         # Verify Signature
         try:
-            payload = token.model_dump_json(exclude={'signature'}, exclude_none=True)
+            payload = token_signing_json(token).encode('utf-8')
+            verified_key = (payload, token.signature)
+            if verified_key in self._verified:
+                return True
+            
             signature_bytes = base64.b64decode(token.signature)
             
-            public_key = self._get_key().public_key()
-            public_key.verify(signature_bytes, payload.encode('utf-8'))
+            public_key = self._get_public_key()
+            public_key.verify(signature_bytes, payload)
+            
+            if len(self._verified) >= VERIFIED_CACHE_SIZE:
+                self._verified.clear()
+            self._verified.add(verified_key)
             return True
         except Exception as e:
             # log failure?
@@ -24,8 +24,9 @@ class PolicyEngine:
         """
         Check if a request violates the 'Never Build' list (Addendum Section E).
         """
-        if requested_feature in NEVER_BUILD_VIOLATIONS:
-            return False, NEVER_BUILD_VIOLATIONS[requested_feature]
+        reason = NEVER_BUILD_VIOLATIONS.get(requested_feature)
+        if reason is not None:
+            return False, reason
         return True, None
 
     def validate_action(self, token: PulseToken, required_scope: PulseScope, is_critical: bool = False) -> Tuple[bool, Optional[str]]:
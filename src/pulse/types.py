@@ -1,7 +1,7 @@
 from enum import Enum
-from typing import List, Optional
-from datetime import datetime
-from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from pydantic import BaseModel, ConfigDict, Field
 
 class PulseScope(str, Enum):
     # Observation Scopes
@@ -24,12 +24,18 @@ class PulseScope(str, Enum):
     ADMIN_SYSTEM = "admin.system"
 
 class TokenConstraints(BaseModel):
+    # Never mutated after issue, so freeze it (also makes it hashable)
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     no_execute: bool = True
     no_settings: bool = True
     no_clipboard_global: bool = True
     require_visible_indicator: bool = True
 
 class PulseToken(BaseModel):
+    # Not frozen: the signature is attached after the payload is signed
+    model_config = ConfigDict(extra='forbid')
+
     token_id: str
     issued_to: str
     scope: List[PulseScope]
@@ -40,9 +46,69 @@ class PulseToken(BaseModel):
     signature: Optional[str] = None
 
 class PulseEvent(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+
     event_id: str
     ts: datetime
     type: str  # "token_issue" | "observe" | "action" | "refusal" | "vault_write"
     payload_hash: str
     prev_hash: str
     signature: Optional[str] = None
+
+
+# Canonical signing payloads, written by hand for the hot path. Each shape of
+# input is checked once against model_dump_json() and the fast form is only
+# trusted if it is byte-identical; anything needing escaping or a non-UTC
+# timestamp goes through pydantic.
+_fast_path_ok: Dict[tuple, bool] = {}
+
+def _is_plain(text: str) -> bool:
+    """Whether a string serializes as itself between quotes."""
+    return text.isascii() and text.isprintable() and '"' not in text and '\\' not in text
+
+def _utc_json(value: datetime) -> Optional[str]:
+    """pydantic's JSON form of a UTC datetime, or None for other offsets."""
+    if value.utcoffset() != timedelta(0):
+        return None
+    return '"' + value.replace(tzinfo=None).isoformat() + 'Z"'
+
+def _json_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+def _checked(shape: tuple, fast: str, model: BaseModel) -> str:
+    ok = _fast_path_ok.get(shape)
+    if ok is None:
+        slow = model.model_dump_json(exclude={'signature'}, exclude_none=True)
+        ok = _fast_path_ok[shape] = fast == slow
+        return slow
+    return fast if ok else model.model_dump_json(exclude={'signature'}, exclude_none=True)
+
+def event_signing_json(event: PulseEvent) -> str:
+    """JSON of an event without its signature, as hashed into the chain."""
+    ts = _utc_json(event.ts)
+    if ts is None or not all(map(_is_plain, (event.event_id, event.type, event.payload_hash, event.prev_hash))):
+        return event.model_dump_json(exclude={'signature'}, exclude_none=True)
+    fast = (
+        f'{{"event_id":"{event.event_id}","ts":{ts},"type":"{event.type}",'
+        f'"payload_hash":"{event.payload_hash}","prev_hash":"{event.prev_hash}"}}'
+    )
+    return _checked(("event", event.ts.microsecond == 0), fast, event)
+
+def token_signing_json(token: PulseToken) -> str:
+    """JSON of a token without its signature, as signed at issue."""
+    start, end = _utc_json(token.start), _utc_json(token.end)
+    if start is None or end is None or not (_is_plain(token.token_id) and _is_plain(token.issued_to)):
+        return token.model_dump_json(exclude={'signature'}, exclude_none=True)
+    c = token.constraints
+    scopes = ",".join(f'"{s.value}"' for s in token.scope)
+    fast = (
+        f'{{"token_id":"{token.token_id}","issued_to":"{token.issued_to}","scope":[{scopes}],'
+        f'"start":{start},"end":{end},"constraints":{{'
+        f'"no_execute":{_json_bool(c.no_execute)},'
+        f'"no_settings":{_json_bool(c.no_settings)},'
+        f'"no_clipboard_global":{_json_bool(c.no_clipboard_global)},'
+        f'"require_visible_indicator":{_json_bool(c.require_visible_indicator)}}},'
+        f'"revocable":{_json_bool(token.revocable)}}}'
+    )
+    shape = ("token", token.start.microsecond == 0, token.end.microsecond == 0)
+    return _checked(shape, fast, token)
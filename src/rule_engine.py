@@ -5,12 +5,14 @@ Rules are Paul-editable YAML.
 Types: hard_block, soft_warn, log_only
 """
 
+import hashlib
 import yaml
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Callable, Dict, Iterator, Tuple
 import re
 
 
@@ -48,57 +50,118 @@ class ContextMode(Enum):
     PLAY = "play"
 
 
-@dataclass
+def _minute_of_day(hhmm: str) -> int:
+    """Minutes since midnight for an "HH:MM" time."""
+    hours, minutes = hhmm.split(":")[:2]
+    return int(hours) * 60 + int(minutes)
+
+
+def _build_predicate(
+    scope: RuleConditionScope,
+    operator: RuleConditionOperator,
+    value: Any
+) -> Callable[..., bool]:
+    """
+    Specialize a condition into a matcher called as
+    (action, content, context, action_lower, content_lower, now).
+    
+    The lowercased inputs and now may be None, in which case the matcher
+    derives what it needs itself.
+    """
+    if scope == RuleConditionScope.ACTION:
+        if operator == RuleConditionOperator.CONTAINS:
+            needle = value.lower()
+            def action_contains(action, content, context, action_lower, content_lower, now):
+                return needle in (action.lower() if action_lower is None else action_lower)
+            return action_contains
+        elif operator == RuleConditionOperator.MATCHES:
+            search = re.compile(value, re.IGNORECASE).search
+            def action_matches(action, content, context, action_lower, content_lower, now):
+                return bool(search(action))
+            return action_matches
+    
+    elif scope == RuleConditionScope.CONTENT:
+        if operator == RuleConditionOperator.CONTAINS:
+            needle = value.lower()
+            def content_contains(action, content, context, action_lower, content_lower, now):
+                return needle in (content.lower() if content_lower is None else content_lower)
+            return content_contains
+        elif operator == RuleConditionOperator.MATCHES:
+            search = re.compile(value, re.IGNORECASE).search
+            def content_matches(action, content, context, action_lower, content_lower, now):
+                return bool(search(content))
+            return content_matches
+    
+    elif scope == RuleConditionScope.TIMING:
+        if operator == RuleConditionOperator.DURING:
+            # value is tuple of (start_time, end_time) like ("22:00", "06:00"),
+            # compared as minutes since midnight, both ends inclusive
+            start, end = (_minute_of_day(t) for t in value)
+            if start <= end:
+                def during(action, content, context, action_lower, content_lower, now):
+                    if now is None:
+                        now = datetime.now()
+                    return start <= now.hour * 60 + now.minute <= end
+            else:  # Crosses midnight
+                def during(action, content, context, action_lower, content_lower, now):
+                    if now is None:
+                        now = datetime.now()
+                    minute = now.hour * 60 + now.minute
+                    return minute >= start or minute <= end
+            return during
+    
+    elif scope == RuleConditionScope.FREQUENCY:
+        if operator == RuleConditionOperator.EXCEEDS:
+            # value is (count, period_minutes)
+            # context should have "action_count" and "period_minutes"
+            count, period = value
+            def exceeds(action, content, context, action_lower, content_lower, now):
+                return context.get("action_count", 0) > count
+            return exceeds
+    
+    def never(action, content, context, action_lower, content_lower, now):
+        return False
+    return never
+
+
+@dataclass(frozen=True)
 class RuleCondition:
     """A condition that triggers a rule."""
     scope: RuleConditionScope
     operator: RuleConditionOperator
     value: Any
+    _predicate: Callable[..., bool] = field(init=False, repr=False, compare=False)
     
-    def evaluate(self, action: str, content: str, context: dict) -> bool:
-        """Evaluate if this condition matches."""
-        if self.scope == RuleConditionScope.ACTION:
-            if self.operator == RuleConditionOperator.CONTAINS:
-                return self.value.lower() in action.lower()
-            elif self.operator == RuleConditionOperator.MATCHES:
-                return bool(re.search(self.value, action, re.IGNORECASE))
-        
-        elif self.scope == RuleConditionScope.CONTENT:
-            if self.operator == RuleConditionOperator.CONTAINS:
-                return self.value.lower() in content.lower()
-            elif self.operator == RuleConditionOperator.MATCHES:
-                return bool(re.search(self.value, content, re.IGNORECASE))
-        
-        elif self.scope == RuleConditionScope.TIMING:
-            if self.operator == RuleConditionOperator.DURING:
-                # value is tuple of (start_time, end_time) like ("22:00", "06:00")
-                now = datetime.now()
-                current_time = now.strftime("%H:%M")
-                start, end = self.value
-                if start <= end:
-                    return start <= current_time <= end
-                else:  # Crosses midnight
-                    return current_time >= start or current_time <= end
-        
-        elif self.scope == RuleConditionScope.FREQUENCY:
-            if self.operator == RuleConditionOperator.EXCEEDS:
-                # value is (count, period_minutes)
-                # context should have "action_count" and "period_minutes"
-                count, period = self.value
-                actual_count = context.get("action_count", 0)
-                return actual_count > count
+    def __post_init__(self):
+        # Resolve scope/operator dispatch once rather than on every evaluation
+        object.__setattr__(self, "_predicate", _build_predicate(self.scope, self.operator, self.value))
+    
+    def evaluate(
+        self,
+        action: str,
+        content: str,
+        context: dict,
+        action_lower: Optional[str] = None,
+        content_lower: Optional[str] = None,
+        now: Optional[datetime] = None
+    ) -> bool:
+        """
+        Evaluate if this condition matches.
         
-        return False
+        action_lower/content_lower may carry lowercased inputs and now the
+        current time when the caller checks many conditions at once.
+        """
+        return self._predicate(action, content, context, action_lower, content_lower, now)
 
 
-@dataclass
+@dataclass(frozen=True)
 class RuleResponse:
     """What happens when a rule triggers."""
     action: RuleResponseAction
     message: str
 
 
-@dataclass 
+@dataclass(frozen=True)
 class Rule:
     """A rule defining a hard boundary."""
     id: str
@@ -122,6 +185,78 @@ class Rule:
 RULES_FILE = Path.home() / ".mirrordna" / "oversight" / "rules.yaml"
 DEFAULT_RULES_FILE = Path(__file__).parent.parent / "config" / "rules.yaml"
 
+# libyaml-backed loader/dumper when available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Parsed rules per file: path -> ((mtime_ns, size), rules)
+_rules_file_cache: Dict[Path, tuple] = {}
+
+# Bound on memoized ACTION-scope condition results
+ACTION_MEMO_SIZE = 4096
+# Bounds on memoized per-call results (keyed on a content digest); longer
+# content is always re-evaluated
+RESULT_CACHE_SIZE = 2048
+RESULT_CACHE_MAX_CONTENT = 64 * 1024
+
+# Built-in rules used when no rules file can be loaded; built once
+_DEFAULT_RULES: Tuple[Rule, ...] = (
+    Rule(
+        id="default-1",
+        name="No late-night file deletion",
+        rule_type=RuleType.HARD_BLOCK,
+        priority=100,
+        condition=RuleCondition(
+            scope=RuleConditionScope.TIMING,
+            operator=RuleConditionOperator.DURING,
+            value=("22:00", "06:00")
+        ),
+        response=RuleResponse(
+            action=RuleResponseAction.BLOCK,
+            message="File deletions blocked during night hours (22:00-06:00)"
+        ),
+        context=ContextMode.ALL,
+        created_by="system",
+        rationale="Prevent accidental destructive actions during low-alertness hours"
+    ),
+    Rule(
+        id="default-2",
+        name="High-frequency tool call warning",
+        rule_type=RuleType.SOFT_WARN,
+        priority=50,
+        condition=RuleCondition(
+            scope=RuleConditionScope.FREQUENCY,
+            operator=RuleConditionOperator.EXCEEDS,
+            value=(20, 5)  # >20 calls in 5 minutes
+        ),
+        response=RuleResponse(
+            action=RuleResponseAction.WARN,
+            message="High frequency of tool calls detected - possible runaway"
+        ),
+        context=ContextMode.ALL,
+        created_by="system",
+        rationale="Detect potential infinite loops or runaway behavior"
+    ),
+    Rule(
+        id="default-3",
+        name="Block credential access",
+        rule_type=RuleType.HARD_BLOCK,
+        priority=100,
+        condition=RuleCondition(
+            scope=RuleConditionScope.CONTENT,
+            operator=RuleConditionOperator.MATCHES,
+            value=r"(?i)(password|api[_\s]?key|secret[_\s]?key|private[_\s]?key|credentials?)"
+        ),
+        response=RuleResponse(
+            action=RuleResponseAction.BLOCK,
+            message="Access to credential-related content blocked"
+        ),
+        context=ContextMode.ALL,
+        created_by="system",
+        rationale="Prevent accidental exposure of sensitive credentials"
+    ),
+)
+
 
 class RuleEngine:
     """
@@ -132,10 +267,52 @@ class RuleEngine:
     def __init__(self, rules_path: Optional[Path] = None):
         self.rules_path = rules_path or RULES_FILE
         self.rules: List[Rule] = []
+        # Alpha memories: rules that can fire per (context, has_content,
+        # has_frequency), ACTION-scope condition results per (rule, action),
+        # and an LRU of whole-call results. All depend only on the rule set,
+        # so they are dropped whenever it changes.
+        self._rules_by_context: Dict[tuple, List[Rule]] = {}
+        self._action_memo: Dict[tuple, bool] = {}
+        self._result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
         self._load_rules()
     
+    def _invalidate_memory(self):
+        """Forget derived rule state after the rule set changes."""
+        self._rules_by_context.clear()
+        self._action_memo.clear()
+        self._result_cache.clear()
+    
+    def _rules_for_context(
+        self,
+        context: str,
+        has_content: bool = True,
+        has_frequency: bool = True
+    ) -> List[Rule]:
+        """
+        Rules that can fire in a context, in priority order.
+        
+        Without content (or frequency data) a CONTENT (or FREQUENCY) condition
+        has a fixed outcome, so such rules are only kept if it is a match.
+        """
+        key = (context, has_content, has_frequency)
+        rules = self._rules_by_context.get(key)
+        if rules is None:
+            rules = []
+            for rule in self.rules:
+                if not rule.matches_context(context):
+                    continue
+                scope = rule.condition.scope
+                if ((scope == RuleConditionScope.CONTENT and not has_content) or
+                        (scope == RuleConditionScope.FREQUENCY and not has_frequency)):
+                    if not rule.condition.evaluate("", "", {}):
+                        continue
+                rules.append(rule)
+            self._rules_by_context[key] = rules
+        return rules
+    
     def _load_rules(self):
         """Load rules from YAML file."""
+        self._invalidate_memory()
         # Try user rules first, fall back to defaults
         rules_file = self.rules_path
         if not rules_file.exists():
@@ -145,8 +322,16 @@ class RuleEngine:
                 return
         
         try:
+            # Rules are immutable, so engines share a parse until the file changes
+            st = rules_file.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = _rules_file_cache.get(rules_file)
+            if cached and cached[0] == stamp:
+                self.rules = list(cached[1])
+                return
+            
             with open(rules_file, 'r') as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
             
             self.rules = []
             for rule_data in data.get("rules", []):
@@ -156,6 +341,7 @@ class RuleEngine:
             
             # Sort by priority (higher first)
             self.rules.sort(key=lambda r: r.priority, reverse=True)
+            _rules_file_cache[rules_file] = (stamp, tuple(self.rules))
         except Exception as e:
             print(f"Warning: Failed to load rules from {rules_file}: {e}")
             self.rules = self._get_default_rules()
@@ -193,62 +379,7 @@ class RuleEngine:
     
     def _get_default_rules(self) -> List[Rule]:
         """Get built-in default rules."""
-        return [
-            Rule(
-                id="default-1",
-                name="No late-night file deletion",
-                rule_type=RuleType.HARD_BLOCK,
-                priority=100,
-                condition=RuleCondition(
-                    scope=RuleConditionScope.TIMING,
-                    operator=RuleConditionOperator.DURING,
-                    value=("22:00", "06:00")
-                ),
-                response=RuleResponse(
-                    action=RuleResponseAction.BLOCK,
-                    message="File deletions blocked during night hours (22:00-06:00)"
-                ),
-                context=ContextMode.ALL,
-                created_by="system",
-                rationale="Prevent accidental destructive actions during low-alertness hours"
-            ),
-            Rule(
-                id="default-2",
-                name="High-frequency tool call warning",
-                rule_type=RuleType.SOFT_WARN,
-                priority=50,
-                condition=RuleCondition(
-                    scope=RuleConditionScope.FREQUENCY,
-                    operator=RuleConditionOperator.EXCEEDS,
-                    value=(20, 5)  # >20 calls in 5 minutes
-                ),
-                response=RuleResponse(
-                    action=RuleResponseAction.WARN,
-                    message="High frequency of tool calls detected - possible runaway"
-                ),
-                context=ContextMode.ALL,
-                created_by="system",
-                rationale="Detect potential infinite loops or runaway behavior"
-            ),
-            Rule(
-                id="default-3",
-                name="Block credential access",
-                rule_type=RuleType.HARD_BLOCK,
-                priority=100,
-                condition=RuleCondition(
-                    scope=RuleConditionScope.CONTENT,
-                    operator=RuleConditionOperator.MATCHES,
-                    value=r"(?i)(password|api[_\s]?key|secret[_\s]?key|private[_\s]?key|credentials?)"
-                ),
-                response=RuleResponse(
-                    action=RuleResponseAction.BLOCK,
-                    message="Access to credential-related content blocked"
-                ),
-                context=ContextMode.ALL,
-                created_by="system",
-                rationale="Prevent accidental exposure of sensitive credentials"
-            ),
-        ]
+        return list(_DEFAULT_RULES)
     
     def evaluate_rules(
         self,
@@ -262,26 +393,100 @@ class RuleEngine:
         
         Returns list of triggered rules with their responses.
         """
-        triggered = []
+        return list(self.iter_triggered_rules(action, content, context, frequency_context))
+    
+    def iter_triggered_rules(
+        self,
+        action: str,
+        content: str,
+        context: str = "all",
+        frequency_context: Optional[dict] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield triggered rules with their responses, highest priority first.
+        
+        Lazy form of evaluate_rules for callers that stop early, e.g. at
+        the first hard block.
+        """
         eval_context = frequency_context or {}
+        has_frequency = bool(frequency_context)
+        rules = self._rules_for_context(context, bool(content), has_frequency)
         
-        for rule in self.rules:
-            # Check context
-            if not rule.matches_context(context):
-                continue
+        # Apart from TIMING and FREQUENCY, which are cheap and re-checked on
+        # every call, conditions are pure functions of these inputs, so
+        # repeated calls reuse their results
+        key = None
+        if not content or len(content) <= RESULT_CACHE_MAX_CONTENT:
+            # Keyed on a digest so the cache doesn't hold on to content
+            digest = hashlib.blake2b(
+                (content or "").encode("utf-8", "surrogatepass"), digest_size=32
+            ).digest()
+            key = (context, action, digest, has_frequency)
+            matches = self._result_cache.get(key)
+        else:
+            matches = None
+        if matches is None:
+            matches = self._match_rules(rules, action, content, eval_context)
+            if key is not None:
+                self._result_cache[key] = matches
+                if len(self._result_cache) > RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+        else:
+            self._result_cache.move_to_end(key)
+        
+        now = None
+        for rule, matched in zip(rules, matches):
+            if matched is None:
+                # Read the clock at most once per call
+                if now is None and rule.condition.scope == RuleConditionScope.TIMING:
+                    now = datetime.now()
+                matched = rule.condition._predicate(action, content, eval_context, None, None, now)
             
-            # Evaluate condition
-            if rule.condition.evaluate(action, content, eval_context):
-                triggered.append({
+            if matched:
+                yield {
                     "rule_id": rule.id,
                     "rule_name": rule.name,
                     "type": rule.rule_type.value,
                     "response_action": rule.response.action.value,
                     "message": rule.response.message,
                     "priority": rule.priority
-                })
+                }
+    
+    def _match_rules(
+        self,
+        rules: List[Rule],
+        action: str,
+        content: str,
+        eval_context: dict
+    ) -> tuple:
+        """Match each rule's condition, leaving None for TIMING and FREQUENCY ones."""
+        matches = []
+        action_lower = action.lower()
+        content_lower = None
         
-        return triggered
+        for rule in rules:
+            condition = rule.condition
+            # ACTION-scope results only depend on the action
+            if condition.scope == RuleConditionScope.ACTION:
+                key = (id(rule), action)
+                matched = self._action_memo.get(key)
+                if matched is None:
+                    matched = condition._predicate(action, content, eval_context, action_lower, None, None)
+                    if len(self._action_memo) >= ACTION_MEMO_SIZE:
+                        self._action_memo.clear()
+                    self._action_memo[key] = matched
+            elif condition.scope in (RuleConditionScope.TIMING, RuleConditionScope.FREQUENCY):
+                matched = None
+            else:
+                # Lowercase content at most once, and only if a rule needs it
+                if content_lower is None and condition.operator == RuleConditionOperator.CONTAINS:
+                    content_lower = content.lower()
+                matched = condition._predicate(
+                    action, content, eval_context, action_lower, content_lower, None
+                )
+            matches.append(matched)
+        
+        return tuple(matches)
     
     def add_rule(self, rule: Rule) -> bool:
         """
@@ -290,6 +495,7 @@ class RuleEngine:
         """
         self.rules.append(rule)
         self.rules.sort(key=lambda r: r.priority, reverse=True)
+        self._invalidate_memory()
         return self._save_rules()
     
     def _save_rules(self) -> bool:
@@ -297,11 +503,19 @@ class RuleEngine:
         try:
             self.rules_path.parent.mkdir(parents=True, exist_ok=True)
             
-            rules_data = {
+            header = {
                 "version": "1.0",
                 "last_modified": datetime.now().isoformat(),
-                "rules": [
-                    {
+            }
+            dump_opts = dict(Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
+            
+            with open(self.rules_path, 'w') as f:
+                yaml.dump(header, f, **dump_opts)
+                # Stream each rule as its own sequence item rather than
+                # building the whole document first
+                f.write("rules:\n" if self.rules else "rules: []\n")
+                for r in self.rules:
+                    yaml.dump([{
                         "id": r.id,
                         "name": r.name,
                         "type": r.rule_type.value,
@@ -318,13 +532,7 @@ class RuleEngine:
                         "context": r.context.value,
                         "created_by": r.created_by,
                         "rationale": r.rationale
-                    }
-                    for r in self.rules
-                ]
-            }
-            
-            with open(self.rules_path, 'w') as f:
-                yaml.dump(rules_data, f, default_flow_style=False, sort_keys=False)
+                    }], f, **dump_opts)
             
             return True
         except Exception as e:
@@ -22,45 +22,78 @@ VIOLATION_MEDICAL_LEGAL = "MEDICAL_LEGAL_ASSERTION"
 # Approval marker for authorized memory writes
 APPROVAL_MARKER = "<!-- APPROVED_WRITE -->"
 
+# Substrings marking a path as memory/state (also covers e.g. current_state.json)
+MEMORY_FILE_MARKERS = ('memory.json', 'state.json', 'handoff.json')
+
 # First-person authority patterns
-FIRST_PERSON_PATTERNS = [
+FIRST_PERSON_PATTERNS = (
     re.compile(r'\bI (?:have )?decided\b', re.I),
     re.compile(r'\bI (?:have )?verified\b', re.I),
     re.compile(r'\bI (?:have )?confirmed\b', re.I),
     re.compile(r'\bI know for certain\b', re.I),
     re.compile(r'\bI (?:have )?determined\b', re.I),
     re.compile(r'\bI am certain\b', re.I),
-]
+)
 
 # Hallucination patterns (fabricated facts)
-HALLUCINATION_PATTERNS = [
+HALLUCINATION_PATTERNS = (
     re.compile(r'\b(Paul|user|client)\s+(confirmed|said|stated|verified|agreed)\b', re.I),
     re.compile(r'\bthe deal was signed\b', re.I),
     re.compile(r'\bstudies prove\b', re.I),
     re.compile(r'\bresearch shows\b', re.I),
     re.compile(r'\bit has been confirmed\b', re.I),
     re.compile(r'\baccording to sources\b', re.I),
-]
+)
 
 # Ownership/acquisition claims
-OWNERSHIP_PATTERNS = [
-    re.compile(r'\b(acquired|purchased|bought|owns)\b.*\b(company|business|shares)\b', re.I),
+OWNERSHIP_PATTERNS = (
+    # Verb ... noun on the same line. Anchored at line start, with the text up
+    # to the first verb captured in a lookahead and matched back: a lookahead
+    # doesn't backtrack (an atomic group without 3.11's (?>...)), so the scan
+    # stays linear on long lines of verbs.
+    re.compile(r'(?:^|(?<=\n))(?=(?P<owner_verb>[^\n]*?\b(?:acquired|purchased|bought|owns)\b))(?P=owner_verb)[^\n]*\b(company|business|shares)\b', re.I),
     re.compile(r'\b(signed|executed)\s+(contract|agreement|deal)\b', re.I),
-]
+)
 
 # Medical/legal assertions
-MEDICAL_LEGAL_PATTERNS = [
+MEDICAL_LEGAL_PATTERNS = (
     re.compile(r'\byou should (take|stop taking)\s+\w+\b', re.I),
     re.compile(r'\b(diagnosed with|diagnosis is)\b', re.I),
     re.compile(r'\blegally (obligated|required|bound)\b', re.I),
     re.compile(r'\bthis constitutes (legal|medical) advice\b', re.I),
-]
+)
 
 # Advice patterns (less severe, logged but allowed in some contexts)
-ADVICE_PATTERNS = [
+ADVICE_PATTERNS = (
     re.compile(r'\byou should definitely\b', re.I),
     re.compile(r'\bI recommend\b', re.I),
-]
+)
+
+
+def _combine(patterns) -> "re.Pattern":
+    """Fuse a category into one alternation so content is scanned once per category."""
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), re.I)
+
+
+FIRST_PERSON_RE = _combine(FIRST_PERSON_PATTERNS)
+HALLUCINATION_RE = _combine(HALLUCINATION_PATTERNS)
+OWNERSHIP_RE = _combine(OWNERSHIP_PATTERNS)
+MEDICAL_LEGAL_RE = _combine(MEDICAL_LEGAL_PATTERNS)
+
+# Lowercase literals, one of which occurs in every match of the category.
+# ASCII content containing none of them can't match, so its regex is skipped.
+FIRST_PERSON_ANCHORS = ("decided", "verified", "confirmed", "certain", "determined")
+HALLUCINATION_ANCHORS = ("paul", "user", "client", "signed", "prove", "shows", "confirmed", "sources")
+OWNERSHIP_ANCHORS = ("acquired", "purchased", "bought", "owns", "signed", "executed")
+MEDICAL_LEGAL_ANCHORS = ("you should", "diagnos", "legally", "constitutes")
+
+# Evaluated in order; the first category that matches decides the violation
+CATEGORY_CHECKS = (
+    (FIRST_PERSON_ANCHORS, FIRST_PERSON_RE, VIOLATION_FIRST_PERSON_AUTHORITY),
+    (HALLUCINATION_ANCHORS, HALLUCINATION_RE, VIOLATION_HALLUCINATED_FACT),
+    (OWNERSHIP_ANCHORS, OWNERSHIP_RE, VIOLATION_OWNERSHIP_CLAIM),
+    (MEDICAL_LEGAL_ANCHORS, MEDICAL_LEGAL_RE, VIOLATION_MEDICAL_LEGAL),
+)
 
 
 def check_content(content: str, resource_path: str) -> Tuple[str, Optional[str]]:
@@ -76,29 +109,20 @@ def check_content(content: str, resource_path: str) -> Tuple[str, Optional[str]]
     """
     
     # Check for unauthorized memory writes
-    is_memory_file = any(x in resource_path for x in ['memory.json', 'state.json', 'handoff.json'])
+    # Every marker ends in .json, so most paths are ruled out by one scan
+    is_memory_file = '.json' in resource_path and any(x in resource_path for x in MEMORY_FILE_MARKERS)
     if is_memory_file and APPROVAL_MARKER not in content:
         return "BLOCK", VIOLATION_UNAUTHORIZED_MEMORY
     
-    # Check first-person authority
-    for pattern in FIRST_PERSON_PATTERNS:
-        if pattern.search(content):
-            return "BLOCK", VIOLATION_FIRST_PERSON_AUTHORITY
-    
-    # Check hallucination patterns
-    for pattern in HALLUCINATION_PATTERNS:
-        if pattern.search(content):
-            return "BLOCK", VIOLATION_HALLUCINATED_FACT
-    
-    # Check ownership claims
-    for pattern in OWNERSHIP_PATTERNS:
-        if pattern.search(content):
-            return "BLOCK", VIOLATION_OWNERSHIP_CLAIM
-    
-    # Check medical/legal assertions
-    for pattern in MEDICAL_LEGAL_PATTERNS:
-        if pattern.search(content):
-            return "BLOCK", VIOLATION_MEDICAL_LEGAL
+    # First-person authority, hallucinated facts, ownership claims,
+    # then medical/legal assertions. For ASCII text lower() folds case exactly
+    # as re.I does, so a missing anchor rules the category out.
+    lowered = content.lower() if content.isascii() else None
+    for anchors, combined, violation in CATEGORY_CHECKS:
+        if lowered is not None and not any(a in lowered for a in anchors):
+            continue
+        if combined.search(content):
+            return "BLOCK", violation
     
     # All checks passed
     return "ALLOW", None
@@ -16,6 +16,22 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    # Fallback to stdlib json if orjson not available
+    orjson = None
+
+
+def _json_loads(content: str) -> Any:
+    """Parse JSON with orjson, deferring to stdlib json for anything it rejects (NaN, big ints)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
 
 class OutputFormat(Enum):
     JSON = "json"
@@ -52,6 +68,11 @@ DEFAULT_SCHEMAS = {
 
 SCHEMA_FILE = Path(__file__).parent.parent / "config" / "output_schemas.yaml"
 
+HEADING_RE = re.compile(r'^(#+)\s', re.MULTILINE)
+LINK_HINT_RE = re.compile(r'\[.+\]\(.+\)')
+LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+CODE_BLOCK_RE = re.compile(r'```(\w+)?\n(.*?)```', re.DOTALL)
+
 
 class SchemaValidator:
     """
@@ -75,25 +96,28 @@ class SchemaValidator:
     
     def detect_format(self, content: str) -> OutputFormat:
         """Detect the format of the content."""
+        return self._detect_format(content)[0]
+    
+    def _detect_format(self, content: str) -> Tuple[OutputFormat, Any]:
+        """Detect the format, also returning the parsed data if it is JSON."""
         content = content.strip()
         
         # Check for JSON
         if content.startswith('{') or content.startswith('['):
             try:
-                json.loads(content)
-                return OutputFormat.JSON
+                return OutputFormat.JSON, _json_loads(content)
             except json.JSONDecodeError:
                 pass
         
         # Check for code blocks
         if content.startswith('```') or content.startswith('def ') or content.startswith('function '):
-            return OutputFormat.CODE
+            return OutputFormat.CODE, None
         
         # Check for markdown
-        if re.search(r'^#+\s', content, re.MULTILINE) or re.search(r'\[.+\]\(.+\)', content):
-            return OutputFormat.MARKDOWN
+        if HEADING_RE.search(content) or LINK_HINT_RE.search(content):
+            return OutputFormat.MARKDOWN, None
         
-        return OutputFormat.TEXT
+        return OutputFormat.TEXT, None
     
     def validate(self, content: str, expected_format: Optional[OutputFormat] = None) -> ValidationResult:
         """
@@ -106,13 +130,17 @@ class SchemaValidator:
         Returns:
             ValidationResult with status and any errors
         """
-        detected = expected_format or self.detect_format(content)
+        parsed = None
+        if expected_format:
+            detected = expected_format
+        else:
+            detected, parsed = self._detect_format(content)
         errors = []
         warnings = []
         metadata = {"format": detected.value}
         
         if detected == OutputFormat.JSON:
-            json_errors, json_warnings = self._validate_json(content)
+            json_errors, json_warnings = self._validate_json(content, parsed)
             errors.extend(json_errors)
             warnings.extend(json_warnings)
         
@@ -135,17 +163,18 @@ class SchemaValidator:
             metadata=metadata
         )
     
-    def _validate_json(self, content: str) -> Tuple[List[str], List[str]]:
-        """Validate JSON content."""
+    def _validate_json(self, content: str, data: Any = None) -> Tuple[List[str], List[str]]:
+        """Validate JSON content, reusing data if detection already parsed it."""
         errors = []
         warnings = []
         schema = self.schemas.get("json_response", {})
         
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
-            errors.append(f"Invalid JSON: {e}")
-            return errors, warnings
+        if data is None:
+            try:
+                data = _json_loads(content)
+            except json.JSONDecodeError as e:
+                errors.append(f"Invalid JSON: {e}")
+                return errors, warnings
         
         if not isinstance(data, dict):
             return errors, warnings  # Array or primitive - no field checks
@@ -176,7 +205,7 @@ class SchemaValidator:
         
         # Check heading depth
         max_depth = schema.get("max_heading_depth", 6)
-        headings = re.findall(r'^(#+)\s', content, re.MULTILINE)
+        headings = HEADING_RE.findall(content)
         for h in headings:
             if len(h) > max_depth:
                 warnings.append(f"Heading depth {len(h)} exceeds max {max_depth}")
@@ -188,7 +217,7 @@ class SchemaValidator:
                 warnings.append(f"Missing required marker: {marker}")
         
         # Check for broken links
-        links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content)
+        links = LINK_RE.findall(content)
         for text, url in links:
             if not url.strip():
                 errors.append(f"Empty link URL: [{text}]()")
@@ -204,7 +233,7 @@ class SchemaValidator:
         schema = self.schemas.get("code_response", {})
         
         # Extract code from markdown blocks if present
-        code_match = re.search(r'```(\w+)?\n(.*?)```', content, re.DOTALL)
+        code_match = CODE_BLOCK_RE.search(content)
         if code_match:
             lang = code_match.group(1) or "unknown"
             code = code_match.group(2)
@@ -227,7 +256,7 @@ class SchemaValidator:
             
             elif lang == "json":
                 try:
-                    json.loads(code)
+                    _json_loads(code)
                 except json.JSONDecodeError as e:
                     errors.append(f"JSON syntax error: {e}")
         
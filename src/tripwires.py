@@ -12,13 +12,34 @@ Tripwires:
 """
 
 import json
-from collections import deque
+import os
+import sys
+import weakref
+from bisect import bisect_left
+from collections import Counter, deque
+from itertools import islice
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-import yaml
+from typing import List, Optional, Dict, Any, Tuple
+
+try:
+    import orjson
+    def _json_line(obj: Any) -> bytes:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        )
+    def _json_dumps_indented(obj: Any) -> str:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+except ImportError:
+    # Fallback to stdlib json if orjson not available
+    def _json_line(obj: Any) -> bytes:
+        return (json.dumps(obj, default=str) + "\n").encode()
+    def _json_dumps_indented(obj: Any) -> str:
+        return json.dumps(obj, indent=2, default=str)
 
 
 class TripwireType(Enum):
@@ -76,6 +97,9 @@ TRIPWIRE_CONFIG = Path.home() / ".mirrordna" / "oversight" / "tripwires.yaml"
 BASELINE_DIR = Path.home() / ".mirrordna" / "oversight" / "baselines"
 METRICS_DIR = Path.home() / ".mirrordna" / "oversight" / "metrics"
 
+# Loop detection looks at this many most recent actions
+LOOP_WINDOW = 10
+
 
 class TripwireSystem:
     """
@@ -89,20 +113,36 @@ class TripwireSystem:
         
         # Rolling action history (configurable window)
         self.action_history: deque = deque(maxlen=1000)
+        # Parallel to action_history: self-initiated actions recorded before each one,
+        # so window counts are a subtraction instead of a scan
+        self._self_initiated_before: deque = deque(maxlen=1000)
+        # Parallel to action_history: epoch seconds of each action, a list so
+        # window starts are found by bisecting plain floats
+        self._history_timestamps: List[float] = []
         
         # Baseline metrics (loaded on init)
         self.baseline: Dict[str, Any] = {}
+        # Set form of baseline["common_targets"], rebuilt when that list is replaced
+        self._common_targets: frozenset = frozenset()
+        self._common_targets_source: Optional[list] = None
         
         # Current session metrics
         self.session_metrics: Dict[str, Any] = {
             "actions_total": 0,
             "actions_self_initiated": 0,
             "unique_targets": set(),
-            "confidence_scores": [],
-            "action_hashes": [],  # For loop detection
+            "confidence_sum": 0.0,  # Running total for the session average
+            "confidence_count": 0,
+            "action_hashes": deque(maxlen=LOOP_WINDOW),  # For loop detection
             "low_confidence_streak": 0
         }
         
+        # Append handle for the current day's event log, kept open between
+        # events; _log_closer closes it at exit if close() isn't called first
+        self._log_fh = None
+        self._log_path: Optional[Path] = None
+        self._log_closer: Optional[weakref.finalize] = None
+        
         self._load_config()
         self._load_baseline()
     
@@ -110,8 +150,7 @@ class TripwireSystem:
         """Load tripwire configuration."""
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r') as f:
-                    data = yaml.safe_load(f) or {}
+                data = self._read_config_data()
                 
                 for tw_data in data.get("tripwires", []):
                     self.configs.append(TripwireConfig(
@@ -128,6 +167,44 @@ class TripwireSystem:
         if not self.configs:
             self.configs = self._default_configs()
     
+    def _read_config_data(self) -> Dict[str, Any]:
+        """
+        Parse the YAML config, going through a JSON sidecar
+        (tripwires.yaml.json) keyed on the YAML file's mtime and size.
+        """
+        st = self.config_path.stat()
+        key = [st.st_mtime_ns, st.st_size]
+        cache_file = self.config_path.with_suffix(self.config_path.suffix + ".json")
+        
+        try:
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+            if cached.get("_key") == key:
+                return cached["data"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass  # Missing or unreadable cache, fall back to YAML
+        
+        # Imported here so a fresh cache never pays for PyYAML
+        import yaml
+        # libyaml-backed loader when available
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(self.config_path, 'r') as f:
+            data = yaml.load(f, Loader=loader) or {}
+        
+        # Best effort: the config dir may be read-only, or the YAML may
+        # hold values JSON can't represent
+        tmp_file = cache_file.with_suffix(".json.tmp")
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump({"_key": key, "data": data}, f)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+        return data
+    
     def _default_configs(self) -> List[TripwireConfig]:
         """Default tripwire configurations per spec."""
         return [
@@ -184,7 +261,8 @@ class TripwireSystem:
             }
     
     def save_baseline(self):
-        """Save current session metrics to baseline."""
+        """Save current session metrics to baseline and close the event log."""
+        self._close_log()
         BASELINE_DIR.mkdir(parents=True, exist_ok=True)
         baseline_file = BASELINE_DIR / "baseline.json"
         
@@ -205,8 +283,8 @@ class TripwireSystem:
                     current_ratio * weight
                 )
             
-            if self.session_metrics["confidence_scores"]:
-                avg_conf = sum(self.session_metrics["confidence_scores"]) / len(self.session_metrics["confidence_scores"])
+            if self.session_metrics["confidence_count"]:
+                avg_conf = self.session_metrics["confidence_sum"] / self.session_metrics["confidence_count"]
                 self.baseline["avg_confidence"] = (
                     self.baseline.get("avg_confidence", 0.8) * (1 - weight) +
                     avg_conf * weight
@@ -218,10 +296,10 @@ class TripwireSystem:
                     self.session_metrics["actions_self_initiated"] / 
                     self.session_metrics["actions_total"]
                 )
-            if self.session_metrics["confidence_scores"]:
+            if self.session_metrics["confidence_count"]:
                 self.baseline["avg_confidence"] = (
-                    sum(self.session_metrics["confidence_scores"]) / 
-                    len(self.session_metrics["confidence_scores"])
+                    self.session_metrics["confidence_sum"] / 
+                    self.session_metrics["confidence_count"]
                 )
         
         self.baseline["sessions_sampled"] = sessions + 1
@@ -229,7 +307,7 @@ class TripwireSystem:
         
         try:
             with open(baseline_file, 'w') as f:
-                json.dump(self.baseline, f, indent=2, default=str)
+                f.write(_json_dumps_indented(self.baseline))
         except Exception as e:
             print(f"Warning: Failed to save baseline: {e}")
     
@@ -240,6 +318,11 @@ class TripwireSystem:
         """
         # Add to history
         self.action_history.append(action)
+        self._self_initiated_before.append(self.session_metrics["actions_self_initiated"])
+        self._history_timestamps.append(action.timestamp.timestamp())
+        if len(self._history_timestamps) > len(self.action_history):
+            # Keep in step with the deque dropping its oldest action
+            del self._history_timestamps[0]
         
         # Update session metrics
         self.session_metrics["actions_total"] += 1
@@ -247,7 +330,8 @@ class TripwireSystem:
             self.session_metrics["actions_self_initiated"] += 1
         
         self.session_metrics["unique_targets"].add(action.target)
-        self.session_metrics["confidence_scores"].append(action.confidence)
+        self.session_metrics["confidence_sum"] += action.confidence
+        self.session_metrics["confidence_count"] += 1
         
         # Track confidence streak
         if action.confidence < 0.5:
@@ -256,8 +340,10 @@ class TripwireSystem:
             self.session_metrics["low_confidence_streak"] = 0
         
         # Track action hash for loop detection
-        action_hash = f"{action.action_type}:{action.target}"
-        self.session_metrics["action_hashes"].append(action_hash)
+        # Keyed as an interned (type, target) pair; formatted only if a loop fires
+        self.session_metrics["action_hashes"].append(
+            (sys.intern(action.action_type), sys.intern(action.target))
+        )
         
         # Check tripwires
         return self.check_tripwires()
@@ -265,81 +351,79 @@ class TripwireSystem:
     def check_tripwires(self) -> List[TripwireEvent]:
         """Check all enabled tripwires against current state."""
         triggered = []
+        now = datetime.now(timezone.utc)  # One clock reading shared by every check
         
         for config in self.configs:
             if not config.enabled:
                 continue
             
-            event = self._check_single_tripwire(config)
+            event = self._check_single_tripwire(config, now)
             if event:
                 triggered.append(event)
                 self._log_tripwire_event(event)
         
         return triggered
     
-    def _check_single_tripwire(self, config: TripwireConfig) -> Optional[TripwireEvent]:
+    def _check_single_tripwire(
+        self,
+        config: TripwireConfig,
+        now: Optional[datetime] = None
+    ) -> Optional[TripwireEvent]:
         """Check a single tripwire."""
-        now = datetime.now(timezone.utc)
-        window_start = now - timedelta(minutes=config.window_minutes)
-        
-        # Get actions in window
-        recent_actions = [
-            a for a in self.action_history 
-            if a.timestamp >= window_start
-        ]
-        
-        if config.tripwire_type == TripwireType.AUTONOMY_CREEP:
-            return self._check_autonomy_creep(config, recent_actions)
-        
-        elif config.tripwire_type == TripwireType.CONFIDENCE_COLLAPSE:
-            return self._check_confidence_collapse(config)
-        
-        elif config.tripwire_type == TripwireType.LOOP_DETECTION:
-            return self._check_loop_detection(config)
-        
-        elif config.tripwire_type == TripwireType.SCOPE_EXPANSION:
-            return self._check_scope_expansion(config, recent_actions)
-        
-        elif config.tripwire_type == TripwireType.DRIFT:
-            return self._check_drift(config, recent_actions)
-        
-        return None
+        check = self._CHECKS.get(config.tripwire_type)
+        if check is None:
+            return None
+        return check(self, config, now or datetime.now(timezone.utc))
+    
+    def _window_start_index(self, config: TripwireConfig, now: datetime) -> int:
+        """Index of the first action in the window (actions are recorded in time order)."""
+        window_start = now.timestamp() - config.window_minutes * 60
+        return bisect_left(self._history_timestamps, window_start)
+    
+    def _window_counts(self, config: TripwireConfig, now: datetime) -> Tuple[int, int]:
+        """Return (total, self_initiated) action counts in the window."""
+        start = self._window_start_index(config, now)
+        total = len(self.action_history) - start
+        if not total:
+            return 0, 0
+        self_initiated = self.session_metrics["actions_self_initiated"] - self._self_initiated_before[start]
+        return total, self_initiated
     
     def _check_autonomy_creep(
         self, 
         config: TripwireConfig, 
-        recent_actions: List[ActionRecord]
+        now: datetime
     ) -> Optional[TripwireEvent]:
         """Check for too many self-initiated actions."""
-        if len(recent_actions) < 5:  # Need minimum sample
+        total, self_initiated = self._window_counts(config, now)
+        if total < 5:  # Need minimum sample
             return None
         
-        self_initiated = sum(1 for a in recent_actions if a.initiated_by == "self")
-        ratio = self_initiated / len(recent_actions)
+        ratio = self_initiated / total
         
         if ratio > config.threshold:
             return TripwireEvent(
                 tripwire_type=TripwireType.AUTONOMY_CREEP,
-                triggered_at=datetime.now(timezone.utc),
+                triggered_at=now,
                 threshold=config.threshold,
                 actual_value=ratio,
                 response=config.response,
                 message=f"Autonomy ratio {ratio:.1%} exceeds threshold {config.threshold:.0%}",
                 context={
                     "self_initiated": self_initiated,
-                    "total": len(recent_actions)
+                    "total": total
                 }
             )
         return None
     
-    def _check_confidence_collapse(self, config: TripwireConfig) -> Optional[TripwireEvent]:
+    def _check_confidence_collapse(self, config: TripwireConfig, now: datetime) -> Optional[TripwireEvent]:
         """Check for streak of low-confidence actions."""
         streak = self.session_metrics["low_confidence_streak"]
         
         if streak >= config.threshold:
             return TripwireEvent(
                 tripwire_type=TripwireType.CONFIDENCE_COLLAPSE,
-                triggered_at=datetime.now(timezone.utc),
+                triggered_at=now,
                 threshold=config.threshold,
                 actual_value=streak,
                 response=config.response,
@@ -348,39 +432,39 @@ class TripwireSystem:
             )
         return None
     
-    def _check_loop_detection(self, config: TripwireConfig) -> Optional[TripwireEvent]:
+    def _check_loop_detection(self, config: TripwireConfig, now: datetime) -> Optional[TripwireEvent]:
         """Check for repeated similar actions."""
         action_hashes = self.session_metrics["action_hashes"]
-        if len(action_hashes) < config.threshold:
+        if not action_hashes or len(action_hashes) < config.threshold:
             return None
         
-        # Check last N actions for repetition
-        recent = action_hashes[-10:]
-        for action in set(recent):
-            count = recent.count(action)
-            if count >= config.threshold:
-                return TripwireEvent(
-                    tripwire_type=TripwireType.LOOP_DETECTION,
-                    triggered_at=datetime.now(timezone.utc),
-                    threshold=config.threshold,
-                    actual_value=count,
-                    response=config.response,
-                    message=f"Loop detected: '{action}' repeated {count} times",
-                    context={"action": action, "count": count}
-                )
+        # The deque only holds the last LOOP_WINDOW actions
+        (action_type, target), count = Counter(action_hashes).most_common(1)[0]
+        if count >= config.threshold:
+            action = f"{action_type}:{target}"
+            return TripwireEvent(
+                tripwire_type=TripwireType.LOOP_DETECTION,
+                triggered_at=now,
+                threshold=config.threshold,
+                actual_value=count,
+                response=config.response,
+                message=f"Loop detected: '{action}' repeated {count} times",
+                context={"action": action, "count": count}
+            )
         return None
     
     def _check_scope_expansion(
         self,
         config: TripwireConfig,
-        recent_actions: List[ActionRecord]
+        now: datetime
     ) -> Optional[TripwireEvent]:
         """Check for access to new areas without prompt."""
         if not self.baseline.get("common_targets"):
             return None  # No baseline yet
         
-        common = set(self.baseline["common_targets"])
+        common = self._common_target_set()
         new_targets = []
+        recent_actions = islice(self.action_history, self._window_start_index(config, now), None)
         
         for action in recent_actions:
             if action.initiated_by == "self" and action.target not in common:
@@ -389,7 +473,7 @@ class TripwireSystem:
         if len(new_targets) >= config.threshold:
             return TripwireEvent(
                 tripwire_type=TripwireType.SCOPE_EXPANSION,
-                triggered_at=datetime.now(timezone.utc),
+                triggered_at=now,
                 threshold=config.threshold,
                 actual_value=len(new_targets),
                 response=config.response,
@@ -398,23 +482,29 @@ class TripwireSystem:
             )
         return None
     
+    def _common_target_set(self) -> frozenset:
+        """Return the baseline's common targets as a set, reusing it until the list changes."""
+        targets = self.baseline.get("common_targets")
+        if targets is not self._common_targets_source:
+            self._common_targets_source = targets
+            self._common_targets = frozenset(targets or ())
+        return self._common_targets
+    
     def _check_drift(
         self,
         config: TripwireConfig,
-        recent_actions: List[ActionRecord]
+        now: datetime
     ) -> Optional[TripwireEvent]:
         """Check for behavioral drift from baseline."""
         if not self.baseline or self.baseline.get("sessions_sampled", 0) < 3:
             return None  # Need baseline
         
-        if len(recent_actions) < 10:
+        total, self_initiated = self._window_counts(config, now)
+        if total < 10:
             return None  # Need sample
         
         # Compare self-initiated ratio
-        current_self_ratio = (
-            sum(1 for a in recent_actions if a.initiated_by == "self") /
-            len(recent_actions)
-        )
+        current_self_ratio = self_initiated / total
         baseline_ratio = self.baseline.get("self_initiated_ratio", 0.2)
         
         drift = abs(current_self_ratio - baseline_ratio)
@@ -422,7 +512,7 @@ class TripwireSystem:
         if drift > config.threshold:
             return TripwireEvent(
                 tripwire_type=TripwireType.DRIFT,
-                triggered_at=datetime.now(timezone.utc),
+                triggered_at=now,
                 threshold=config.threshold,
                 actual_value=drift,
                 response=config.response,
@@ -434,11 +524,20 @@ class TripwireSystem:
             )
         return None
     
+    # Check for each tripwire type, called as check(self, config, now)
+    _CHECKS = {
+        TripwireType.DRIFT: _check_drift,
+        TripwireType.AUTONOMY_CREEP: _check_autonomy_creep,
+        TripwireType.SCOPE_EXPANSION: _check_scope_expansion,
+        TripwireType.CONFIDENCE_COLLAPSE: _check_confidence_collapse,
+        TripwireType.LOOP_DETECTION: _check_loop_detection,
+    }
+    
     def _log_tripwire_event(self, event: TripwireEvent):
         """Log tripwire event to metrics directory."""
-        METRICS_DIR.mkdir(parents=True, exist_ok=True)
-        
-        log_file = METRICS_DIR / f"tripwire_{datetime.now().strftime('%Y%m%d')}.jsonl"
+        log_file = METRICS_DIR / f"tripwire_{event.triggered_at.astimezone().strftime('%Y%m%d')}.jsonl"
+        if log_file != self._log_path:
+            METRICS_DIR.mkdir(parents=True, exist_ok=True)
         
         record = {
             "type": event.tripwire_type.value,
@@ -451,7 +550,28 @@ class TripwireSystem:
         }
         
         try:
-            with open(log_file, 'a') as f:
-                f.write(json.dumps(record, default=str) + "\n")
+            if log_file != self._log_path:
+                self._close_log()
+                # Unbuffered append: each event is a single write() of one whole line
+                self._log_fh = open(log_file, 'ab', buffering=0)
+                self._log_path = log_file
+                self._log_closer = weakref.finalize(self, self._log_fh.close)
+            self._log_fh.write(_json_line(record))
         except Exception as e:
+            self._close_log()
             print(f"Warning: Failed to log tripwire event: {e}")
+    
+    def close(self):
+        """Close the tripwire event log; it is reopened by the next event."""
+        self._close_log()
+    
+    def _close_log(self):
+        """Close the event log handle, if one is open."""
+        if self._log_closer is not None:
+            try:
+                self._log_closer()
+            except OSError:
+                pass
+        self._log_fh = None
+        self._log_path = None
+        self._log_closer = None
@@ -49,6 +49,23 @@ class TestKeyGeneration:
         
         assert loaded is not None
     
+    def test_load_private_key_reuses_parsed_key(self, temp_mirrorgate_dir):
+        from src.crypto import generate_keypair, load_private_key
+        from cryptography.hazmat.primitives import serialization
+        
+        generate_keypair()
+        first = load_private_key()
+        assert load_private_key() is first
+        
+        # Rotating the key on disk is picked up
+        rotated, _ = generate_keypair()
+        raw = lambda k: k.private_bytes(
+            serialization.Encoding.Raw,
+            serialization.PrivateFormat.Raw,
+            serialization.NoEncryption()
+        )
+        assert raw(load_private_key()) == raw(rotated)
+    
     def test_load_generates_if_missing(self, temp_mirrorgate_dir):
         from src.crypto import load_private_key, KEYS_DIR
         
@@ -174,6 +174,36 @@ class TestDBBGenerator:
         assert "chain_hash" in data
         assert len(data["chain_hash"]) == 64  # SHA-256
 
+    def test_list_decisions_sees_new_files(self, tmp_path, monkeypatch):
+        """Test that cached listings pick up decisions written later."""
+        import src.forensics.dbb_generator as dbb_mod
+        monkeypatch.setattr(dbb_mod, "DBB_DIR", tmp_path / "dbb")
+
+        generator = DBBGenerator()
+        generator.generate(decision_type="BLOCK", target="/a", reasoning_trace=["1"])
+        assert len(generator.list_decisions()) == 1
+
+        generator.generate(decision_type="ALLOW", target="/b", reasoning_trace=["2"])
+        decisions = generator.list_decisions()
+        assert len(decisions) == 2
+        assert {d["target"] for d in decisions} == {"/a", "/b"}
+
+    def test_list_decisions_retries_unreadable_files(self, tmp_path, monkeypatch):
+        """Test that a half-written decision isn't hidden by the listing cache."""
+        import src.forensics.dbb_generator as dbb_mod
+        monkeypatch.setattr(dbb_mod, "DBB_DIR", tmp_path / "dbb")
+
+        generator = DBBGenerator()
+        path = Path(generator.generate(decision_type="BLOCK", target="/a", reasoning_trace=["1"]))
+        content = path.read_text()
+        path.write_text(content[:10])
+        assert generator.list_decisions() == []
+
+        # Finishing the write in place leaves the directory mtime unchanged
+        path.write_text(content)
+        decisions = generator.list_decisions()
+        assert [d["target"] for d in decisions] == ["/a"]
+
 
 class TestSessionReplayAndExport:
     """Test session replay and export functionality."""
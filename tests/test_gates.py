@@ -9,7 +9,7 @@ from src.gates import run_gates, GateResult, IntentMode, GateChainResult
 from src.gates.gate0_transport import Gate0Transport, RateLimitConfig
 from src.gates.gate3_injection import Gate3Injection
 from src.gates.gate4_complexity import Gate4Complexity, ComplexityConfig
-from src.gates.gate5_intent import Gate5Intent
+from src.gates.gate5_intent import Gate5Intent, IntentSignal, INTENT_SIGNALS
 
 
 class TestGate0Transport:
@@ -212,6 +212,27 @@ class TestGate5Intent:
         assert IntentMode.REFLECTIVE.value in breakdown
         assert IntentMode.PLAY.value in breakdown
 
+    @pytest.mark.parametrize("greeting", ["hi", "Thanks!", "ok.", "thank you?!"])
+    def test_greeting_fast_path_matches_full_scan(self, greeting):
+        gate = Gate5Intent()
+        full_scan = Gate5Intent(signals=list(INTENT_SIGNALS))
+
+        fast = gate.evaluate({"content": greeting}).metadata
+        slow = full_scan.evaluate({"content": greeting}).metadata
+        assert fast == slow
+        assert fast["mode"] == IntentMode.TRANSACTIONAL.value
+
+    def test_classification_ignores_case(self):
+        gate = Gate5Intent()
+        lower = gate.evaluate({"content": "should i write a story?"}).metadata
+        upper = gate.evaluate({"content": "SHOULD I WRITE A STORY?"}).metadata
+        assert lower["score_breakdown"] == upper["score_breakdown"]
+
+    def test_case_sensitive_signal_matches_as_written(self):
+        gate = Gate5Intent(signals=[IntentSignal(r"URGENT", IntentMode.REFLECTIVE, 0.9)])
+        assert gate.evaluate({"content": "URGENT: help"}).metadata["mode"] == IntentMode.REFLECTIVE.value
+        assert gate.evaluate({"content": "urgent: help"}).metadata["confidence"] == 0.3
+
 
 class TestGateChain:
     """Test full gate chain integration"""
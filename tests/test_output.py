@@ -50,7 +50,18 @@ class TestOutputEnforcement:
         result = enforcer.enforce(output)
         
         assert result.result == EnforcementResult.BLOCK
-    
+
+    def test_forbidden_prefilter_is_case_insensitive(self, enforcer):
+        """Test that the substring prefilter doesn't hide uppercase leaks."""
+        result = enforcer.enforce("PASSWORD: 'hunter2hunter2'")
+        assert result.result == EnforcementResult.BLOCK
+
+    def test_custom_forbidden_patterns_skip_prefilter(self):
+        """Test that custom forbidden patterns are always evaluated."""
+        enforcer = OutputEnforcement(forbidden_patterns=[(r"launch codes", "secrets")])
+        result = enforcer.enforce("Here are the launch codes")
+        assert result.result == EnforcementResult.BLOCK
+
     def test_prescriptive_language_rewritten(self, enforcer):
         """Test that prescriptive language is rewritten."""
         output = "You should definitely do this first."
@@ -68,6 +79,13 @@ class TestOutputEnforcement:
         assert result.result == EnforcementResult.REWRITE
         assert "definitely" not in result.output.lower() or "likely" in result.output.lower()
     
+    def test_hedging_matches_whole_phrases(self, enforcer):
+        """Test that hedging prefers longer phrases and skips partial words."""
+        text, count = enforcer._apply_hedging("Absolutely sure the hallways never end")
+
+        assert text == "Fairly confident the hallways rarely end"
+        assert count == 2
+
     def test_multiple_issues_handled(self, enforcer):
         """Test that multiple issues are handled."""
         output = "You must absolutely do this."
@@ -115,6 +133,14 @@ class TestSchemaValidator:
         assert result.valid is True
         assert result.format_detected == OutputFormat.JSON
     
+    def test_json_outside_strict_parsers_detected(self, validator):
+        """Test that JSON the stdlib accepts (NaN, big ints) is still JSON."""
+        content = '{"status": NaN, "data": 123456789012345678901234567890, "api_key": 1}'
+        result = validator.validate(content)
+
+        assert result.format_detected == OutputFormat.JSON
+        assert "Forbidden field present: api_key" in result.errors
+
     def test_invalid_json_fails(self, validator):
         """Test invalid JSON fails validation when expected as JSON."""
         content = '{"status": "ok", invalid}'
@@ -148,6 +174,14 @@ class TestSchemaValidator:
         assert result.valid is False
         assert any("syntax" in e.lower() for e in result.errors)
 
+    def test_json_code_block_validation(self, validator):
+        """Test JSON syntax validation inside code blocks."""
+        assert validator.validate('```json\n{"a": [1, 2]}\n```').valid is True
+
+        result = validator.validate('```json\n{"a": 1,}\n```')
+        assert result.valid is False
+        assert result.errors[0].startswith("JSON syntax error: Expecting property name")
+
 
 class TestPostfilters:
     """Test postfilter chain."""
@@ -169,6 +203,19 @@ class TestPostfilters:
         assert result["rewrites"] > 0
         assert "should" not in result["output"] or "might consider" in result["output"]
     
+    def test_prescriptive_rewrites_all_phrases_in_one_pass(self):
+        """Test that every prescriptive phrase is rewritten and reported once."""
+        output = "I recommend you must do this. You should do this."
+        result = run_postfilters(output, mode="TRANSACTIONAL")
+
+        assert result["output"] == "One option is it may help to consider this. You might consider consider this."
+        assert result["violations"] == [
+            "prescriptive:you should",
+            "prescriptive:you must",
+            "prescriptive:do this",
+            "prescriptive:I recommend",
+        ]
+
     def test_prescriptive_allowed_in_play(self):
         """Test prescriptive language is allowed in play mode."""
         output = "You should definitely try this!"
@@ -186,6 +233,11 @@ class TestPostfilters:
         # Should have uncertainty marker added
         assert "⟡" in result["output"] or "perhaps" in result["output"].lower()
     
+    def test_unknown_mode_filters_like_transactional(self):
+        """Test that an unrecognised mode gets the transactional filters."""
+        output = "You should do this. This is the answer."
+        assert run_postfilters(output, mode="CUSTOM") == run_postfilters(output, mode="TRANSACTIONAL")
+    
     def test_uncertainty_not_needed_if_present(self):
         """Test uncertainty not added if already present."""
         output = "Perhaps this could be considered."
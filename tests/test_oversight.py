@@ -6,6 +6,7 @@ Covers consent manager, rule engine, and tripwires.
 import pytest
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+import json
 import tempfile
 import os
 
@@ -16,7 +17,16 @@ from src.consent_manager import (
     ContextMode,
     EscalationTrigger
 )
-from src.rule_engine import RuleEngine, RuleType
+from src.rule_engine import (
+    RuleEngine,
+    RuleType,
+    Rule,
+    RuleCondition,
+    RuleConditionScope,
+    RuleConditionOperator,
+    RuleResponse,
+    RuleResponseAction,
+)
 from src.tripwires import (
     TripwireSystem, 
     ActionRecord, 
@@ -90,6 +100,33 @@ class TestConsentManager:
             "~/MirrorDNA-Vault/test.md"
         ) is False
     
+    def test_cached_checks_follow_grant_and_revoke(self, manager):
+        """Test that repeated checks see grants and revokes immediately."""
+        check = (PermissionScope.NETWORK, PermissionAction.SEND, "api.example.com")
+        assert manager.check_permission(*check) is False
+        
+        perm = manager.grant_permission(
+            scope=PermissionScope.NETWORK,
+            action=PermissionAction.SEND,
+            target="api.example.com"
+        )
+        assert manager.check_permission(*check) is True
+        assert manager.check_permission(*check) is True
+        
+        manager.revoke_permission(perm.id)
+        assert manager.check_permission(*check) is False
+    
+    def test_cached_checks_see_other_managers_changes(self, manager):
+        """Test that a revoke through another manager takes effect at once."""
+        other = ConsentManager(db_path=manager.db_path)
+        check = (PermissionScope.NETWORK, PermissionAction.SEND, "api.example.com")
+        perm = other.grant_permission(PermissionScope.NETWORK, PermissionAction.SEND, "api.example.com")
+        assert manager.check_permission(*check) is True
+        assert manager.check_permission(*check) is True
+        
+        other.revoke_permission(perm.id)
+        assert manager.check_permission(*check) is False
+    
     def test_permission_with_expiry(self, manager):
         """Test permission expiry."""
         # Create permission that expires in the past
@@ -135,6 +172,15 @@ class TestConsentManager:
         # Should have 1 remaining
         assert len(manager.list_permissions()) == 1
 
+    def test_count_permissions_skips_expired(self, manager):
+        """Test that the active count ignores expired permissions."""
+        past = datetime.now(timezone.utc) - timedelta(hours=1)
+        manager.grant_permission(PermissionScope.DEVICE, PermissionAction.READ, "*", expires_at=past)
+        manager.grant_permission(PermissionScope.DEVICE, PermissionAction.READ, "*")
+
+        assert manager.count_permissions() == 1
+        assert manager.count_permissions() == len(manager.list_permissions())
+
 
 class TestRuleEngine:
     """Test rule engine evaluation."""
@@ -185,6 +231,115 @@ class TestRuleEngine:
         warnings = [r for r in triggered if r["type"] == "soft_warn"]
         assert len(warnings) >= 1
 
+    def test_iter_triggered_rules_stops_at_first_block(self, engine):
+        """Test that the lazy form yields the same rules in the same order."""
+        content = "api_key and ~/.ssh/id_rsa"
+        triggered = engine.evaluate_rules("write", content)
+        assert list(engine.iter_triggered_rules("write", content)) == triggered
+
+        first_block = next(r for r in engine.iter_triggered_rules("write", content) if r["type"] == "hard_block")
+        assert first_block == next(r for r in triggered if r["type"] == "hard_block")
+
+    def test_timing_condition_crosses_midnight(self):
+        """Test that an overnight window matches on both sides of midnight."""
+        night = RuleCondition(
+            scope=RuleConditionScope.TIMING,
+            operator=RuleConditionOperator.DURING,
+            value=("22:00", "06:00")
+        )
+        assert night.evaluate("", "", {}, now=datetime(2026, 1, 1, 23, 30))
+        assert night.evaluate("", "", {}, now=datetime(2026, 1, 2, 5, 59))
+        assert not night.evaluate("", "", {}, now=datetime(2026, 1, 2, 12, 0))
+
+    def test_repeated_calls_follow_frequency(self, engine):
+        """Test that cached results still track action counts and stay independent."""
+        frequency_rules = {r.id for r in engine.list_rules() if r.condition.scope == RuleConditionScope.FREQUENCY}
+
+        def warned(count):
+            triggered = engine.evaluate_rules("tool_call", "", frequency_context={"action_count": count})
+            return any(r["rule_id"] in frequency_rules for r in triggered)
+
+        assert warned(25) and not warned(5) and warned(25)
+
+        first = engine.evaluate_rules("read", "api_key: abc123")
+        first[0]["message"] = "changed"
+        assert engine.evaluate_rules("read", "api_key: abc123")[0]["message"] != "changed"
+
+    def test_added_rule_applies_to_repeated_action(self, engine):
+        """Test that memoized evaluations pick up newly added rules."""
+        assert not any(r["rule_id"] == "no-delete" for r in engine.evaluate_rules("delete", ""))
+        
+        engine.add_rule(Rule(
+            id="no-delete",
+            name="No deletes",
+            rule_type=RuleType.HARD_BLOCK,
+            priority=10,
+            condition=RuleCondition(
+                scope=RuleConditionScope.ACTION,
+                operator=RuleConditionOperator.CONTAINS,
+                value="delete"
+            ),
+            response=RuleResponse(action=RuleResponseAction.BLOCK, message="Deletes blocked")
+        ))
+        
+        triggered = engine.evaluate_rules("delete", "")
+        assert any(r["rule_id"] == "no-delete" for r in triggered)
+        assert not any(r["rule_id"] == "no-delete" for r in engine.evaluate_rules("read", ""))
+
+    def test_yaml_rules_precompiled_on_load(self, tmp_path):
+        """Test that YAML conditions are compiled once and bad regexes are skipped."""
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(
+            "rules:\n"
+            "  - {id: bad, type: hard_block, condition: {scope: content, operator: matches, value: '(unclosed'}}\n"
+            "  - {id: tps, type: soft_warn, condition: {scope: content, operator: contains, value: TPS Report}}\n"
+        )
+        engine = RuleEngine(rules_path=rules_path)
+
+        assert [r.id for r in engine.list_rules()] == ["tps"]
+        triggered = engine.evaluate_rules("write", "Where is the tps report?")
+        assert [r["rule_id"] for r in triggered] == ["tps"]
+
+    def test_saved_rules_reload(self, engine):
+        """Test that saved rules round-trip and unchanged files are parsed once."""
+        engine.add_rule(Rule(
+            id="quiet-hours",
+            name="Quiet hours",
+            rule_type=RuleType.LOG_ONLY,
+            priority=1,
+            condition=RuleCondition(
+                scope=RuleConditionScope.TIMING,
+                operator=RuleConditionOperator.DURING,
+                value=("23:00", "05:00")
+            ),
+            response=RuleResponse(action=RuleResponseAction.LOG, message="Quiet hours")
+        ))
+
+        first = RuleEngine(rules_path=engine.rules_path)
+        second = RuleEngine(rules_path=engine.rules_path)
+        assert [r.id for r in first.list_rules()] == [r.id for r in engine.list_rules()]
+        assert first.get_rule("quiet-hours").condition.value == ["23:00", "05:00"]
+        assert second.get_rule("quiet-hours") is first.get_rule("quiet-hours")
+
+    def test_content_rules_still_see_empty_content(self, engine):
+        """Test that skipping content rules for empty writes keeps their outcome."""
+        engine.add_rule(Rule(
+            id="empty-write",
+            name="Empty write",
+            rule_type=RuleType.LOG_ONLY,
+            priority=1,
+            condition=RuleCondition(
+                scope=RuleConditionScope.CONTENT,
+                operator=RuleConditionOperator.MATCHES,
+                value=r"^\s*$"
+            ),
+            response=RuleResponse(action=RuleResponseAction.LOG, message="Empty write")
+        ))
+
+        assert any(r["rule_id"] == "empty-write" for r in engine.evaluate_rules("write", ""))
+        assert not any(r["rule_id"] == "empty-write" for r in engine.evaluate_rules("write", "text"))
+        assert not any("credential" in r["message"].lower() for r in engine.evaluate_rules("write", ""))
+
 
 class TestTripwireSystem:
     """Test tripwire detection."""
@@ -198,7 +353,20 @@ class TestTripwireSystem:
     def test_default_configs_loaded(self, tripwires):
         """Test that default tripwire configs are loaded."""
         assert len(tripwires.configs) >= 5
-    
+
+    def test_config_parse_cached_alongside_yaml(self, tmp_path):
+        """Test that the JSON sidecar is used until the YAML changes."""
+        config_path = tmp_path / "tripwires.yaml"
+        config_path.write_text("tripwires:\n  - type: loop_detection\n    threshold: 4\n")
+
+        assert TripwireSystem(config_path=config_path).configs[0].threshold == 4
+        assert (tmp_path / "tripwires.yaml.json").exists()
+        assert TripwireSystem(config_path=config_path).configs[0].threshold == 4
+
+        config_path.write_text("tripwires:\n  - type: loop_detection\n    threshold: 12\n")
+        configs = TripwireSystem(config_path=config_path).configs
+        assert [(c.tripwire_type, c.threshold) for c in configs] == [(TripwireType.LOOP_DETECTION, 12)]
+
     def test_loop_detection(self, tripwires):
         """Test loop detection tripwire."""
         # Record repeated actions
@@ -215,7 +383,50 @@ class TestTripwireSystem:
         
         # Should trigger loop detection
         assert any(e.tripwire_type == TripwireType.LOOP_DETECTION for e in events)
-    
+        loop = next(e for e in events if e.tripwire_type == TripwireType.LOOP_DETECTION)
+        assert loop.context == {"action": "file_write:/same/file.txt", "count": 5}
+
+    def test_events_logged_through_one_handle(self, tripwires, tmp_path, monkeypatch):
+        """Test that every triggered event is appended to the day's log."""
+        import src.tripwires as tripwires_module
+        monkeypatch.setattr(tripwires_module, "METRICS_DIR", tmp_path / "metrics")
+
+        logged = []
+        for i in range(5):
+            logged += tripwires.record_action(ActionRecord(
+                timestamp=datetime.now(timezone.utc),
+                action_type="file_write",
+                target="/same/file.txt",
+                confidence=0.9,
+                initiated_by="user",
+                success=True
+            ))
+            if i == 2:
+                handle = tripwires._log_fh
+
+        assert tripwires._log_fh is handle
+        (log_file,) = (tmp_path / "metrics").iterdir()
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == len(logged) == 3
+        assert all(json.loads(line)["type"] == "loop_detection" for line in lines)
+
+    def test_loop_detection_forgets_old_actions(self, tripwires):
+        """Test that only the most recent actions count towards a loop."""
+        targets = ["/same/file.txt"] * 3 + [f"/target/{i}" for i in range(10)]
+        for target in targets:
+            events = tripwires.record_action(ActionRecord(
+                timestamp=datetime.now(timezone.utc),
+                action_type="file_write",
+                target=target,
+                confidence=0.9,
+                initiated_by="user",
+                success=True
+            ))
+
+        assert len(tripwires.session_metrics["action_hashes"]) == 10
+        assert not any(e.tripwire_type == TripwireType.LOOP_DETECTION for e in events)
+        assert tripwires.session_metrics["confidence_count"] == len(targets)
+
     def test_confidence_collapse(self, tripwires):
         """Test confidence collapse detection."""
         # Record low-confidence actions
@@ -232,7 +443,10 @@ class TestTripwireSystem:
         
         # Should trigger confidence collapse
         assert any(e.tripwire_type == TripwireType.CONFIDENCE_COLLAPSE for e in events)
-    
+        # Checks from one recorded action share a single timestamp
+        assert len(events) > 1
+        assert len({e.triggered_at for e in events}) == 1
+
     def test_autonomy_creep(self, tripwires):
         """Test autonomy creep detection."""
         # Record many self-initiated actions
@@ -249,7 +463,45 @@ class TestTripwireSystem:
         
         # Should trigger autonomy creep (100% self-initiated > 40%)
         assert any(e.tripwire_type == TripwireType.AUTONOMY_CREEP for e in events)
-    
+
+    def test_autonomy_creep_only_counts_window(self, tripwires):
+        """Test that self-initiated actions outside the window are ignored."""
+        now = datetime.now(timezone.utc)
+        records = [(now - timedelta(hours=2), "self")] * 10 + [(now, "user")] * 3 + [(now, "self")] * 3
+        for i, (timestamp, initiated_by) in enumerate(records):
+            events = tripwires.record_action(ActionRecord(
+                timestamp=timestamp,
+                action_type=f"action_{i}",
+                target=f"/target/{i}",
+                confidence=0.9,
+                initiated_by=initiated_by,
+                success=True
+            ))
+            if i < 10:
+                assert not any(e.tripwire_type == TripwireType.AUTONOMY_CREEP for e in events)
+
+        creep = [e for e in events if e.tripwire_type == TripwireType.AUTONOMY_CREEP]
+        assert creep[0].context == {"self_initiated": 3, "total": 6}
+
+    def test_scope_expansion_follows_baseline_targets(self, tripwires):
+        """Test that scope expansion uses the current baseline targets."""
+        def record(target):
+            return tripwires.record_action(ActionRecord(
+                timestamp=datetime.now(timezone.utc),
+                action_type="read",
+                target=target,
+                confidence=0.9,
+                initiated_by="self",
+                success=True
+            ))
+
+        tripwires.baseline["common_targets"] = ["/known"]
+        assert not any(e.tripwire_type == TripwireType.SCOPE_EXPANSION for e in record("/known"))
+        assert any(e.tripwire_type == TripwireType.SCOPE_EXPANSION for e in record("/new"))
+
+        tripwires.baseline["common_targets"] = ["/known", "/new"]
+        assert not any(e.tripwire_type == TripwireType.SCOPE_EXPANSION for e in record("/new"))
+
     def test_normal_behavior_no_triggers(self, tripwires):
         """Test that normal behavior doesn't trigger."""
         # Varied actions, mixed initiation
@@ -6,8 +6,9 @@ from datetime import datetime, timezone
 sys.path.append("/Users/mirror-admin/Documents/GitHub/MirrorGate/src")
 
 from pulse.core import pulse
-from pulse.types import PulseScope, TokenConstraints
+from pulse.types import PulseScope, TokenConstraints, PulseEvent, token_signing_json, event_signing_json
 from pulse.policy import policy
+import pulse.types as pulse_types
 
 class TestPulseRedTeam(unittest.TestCase):
     
@@ -63,5 +64,30 @@ class TestPulseRedTeam(unittest.TestCase):
         self.assertTrue(valid)
         print("✅ Critical Execution Allowed (when explicitly unlocked)")
 
+    def test_canonical_payloads_match_pydantic(self):
+        """Verify hand-written signing payloads are byte-identical to model_dump_json."""
+        now = datetime.now(timezone.utc)
+        for ts in (now, now.replace(microsecond=0)):
+            token = pulse.issue_token(
+                issued_to="canon_check",
+                scopes=[PulseScope.OBSERVE_APP, PulseScope.INPUT_DRAFT],
+                constraints=TokenConstraints(no_execute=False)
+            ).model_copy(update={"start": ts})
+            event = PulseEvent(event_id="e1", ts=ts, type="observe", payload_hash="0" * 64, prev_hash="GENESIS")
+            
+            # Twice each: the first call checks the shape, the second takes the fast path
+            for _ in range(2):
+                self.assertEqual(
+                    token_signing_json(token),
+                    token.model_dump_json(exclude={'signature'}, exclude_none=True)
+                )
+                self.assertEqual(
+                    event_signing_json(event),
+                    event.model_dump_json(exclude={'signature'}, exclude_none=True)
+                )
+        self.assertTrue(pulse_types._fast_path_ok)
+        self.assertNotIn(False, pulse_types._fast_path_ok.values())
+        self.assertTrue(pulse.verify_token(pulse.issue_token("canon_check", [PulseScope.OBSERVE_APP])))
+
 if __name__ == "__main__":
     unittest.main()
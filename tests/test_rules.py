@@ -40,7 +40,13 @@ class TestFirstPersonAuthority:
         action, code = check_content(content, "/test/file.md")
         assert action == "BLOCK"
         assert code == VIOLATION_FIRST_PERSON_AUTHORITY
-    
+
+    def test_case_and_non_ascii_still_detected(self):
+        for content in ("I HAVE DECIDED to ship it.", "Résumé review: I have decided.", "I VERİFIED it."):
+            action, code = check_content(content, "/test/file.md")
+            assert action == "BLOCK"
+            assert code == VIOLATION_FIRST_PERSON_AUTHORITY
+
     def test_allowed_first_person(self):
         # "I think" is allowed - it's not authoritative
         content = "I think we should consider this option."
@@ -92,6 +98,12 @@ class TestUnauthorizedMemory:
         assert action == "ALLOW"
         assert code is None
     
+    def test_prefixed_state_file_guarded(self):
+        content = "Overwrite state"
+        action, code = check_content(content, "/home/u/.mirrordna/current_state.json")
+        assert action == "BLOCK"
+        assert code == VIOLATION_UNAUTHORIZED_MEMORY
+
     def test_non_memory_file(self):
         content = '{"data": "some value"}'
         action, code = check_content(content, "/path/to/notes.json")
@@ -107,7 +119,19 @@ class TestOwnershipClaims:
         action, code = check_content(content, "/test/file.md")
         assert action == "BLOCK"
         assert code == VIOLATION_OWNERSHIP_CLAIM
-    
+
+    def test_ownership_noun_must_share_line(self):
+        content = "We acquired new skills.\nThe company picnic was fun."
+        action, code = check_content(content, "/test/file.md")
+        assert action == "ALLOW"
+        assert code is None
+
+    def test_repeated_verbs_scan_quickly(self):
+        content = "acquired " * 20000
+        action, code = check_content(content, "/test/file.md")
+        assert action == "ALLOW"
+        assert check_content(content + "shares", "/test/file.md")[1] == VIOLATION_OWNERSHIP_CLAIM
+
     def test_signed_contract(self):
         content = "We have signed contract documents for review."
         action, code = check_content(content, "/test/file.md")